@@ -65,6 +65,7 @@ __all__ = [
     "bm_central_moment",
     "bm_eatamsd",
     "bm_fpt",
+    "bm_fpt_batch",
     "bm_fpt_central_moment",
     "bm_fpt_raw_moment",
     "bm_frac_central_moment",
@@ -107,46 +108,66 @@ __all__ = [
     "ctrw_simulate_duration",
     "ctrw_simulate_step",
     "eatamsd",
+    "ensure_float",
     "exp_rand",
     "exp_rands",
+    "fbm_antithetic_moment",
     "fbm_central_moment",
     "fbm_eatamsd",
+    "fbm_endpoints",
     "fbm_fpt",
+    "fbm_fpt_batch",
     "fbm_fpt_central_moment",
+    "fbm_fpt_moment_grid",
+    "fbm_fpt_moments",
     "fbm_fpt_raw_moment",
     "fbm_frac_central_moment",
     "fbm_frac_raw_moment",
     "fbm_mean",
+    "fbm_mean_msd",
     "fbm_msd",
     "fbm_occupation_time",
     "fbm_occupation_time_central_moment",
     "fbm_occupation_time_raw_moment",
     "fbm_raw_moment",
     "fbm_simulate",
+    "fbm_simulate_batch",
+    "fbm_simulate_batch_f32",
+    "fbm_simulate_f32",
     "fbm_tamsd",
+    "fbm_validate_params",
     "gamma_central_moment",
     "gamma_eatamsd",
     "gamma_fpt",
+    "gamma_fpt_batch",
+    "gamma_fpt_bridge",
     "gamma_fpt_central_moment",
     "gamma_fpt_raw_moment",
     "gamma_frac_central_moment",
     "gamma_frac_raw_moment",
     "gamma_mean",
+    "gamma_moments",
+    "gamma_moments_over_durations",
     "gamma_msd",
     "gamma_occupation_time",
     "gamma_occupation_time_central_moment",
     "gamma_occupation_time_raw_moment",
     "gamma_raw_moment",
     "gamma_simulate",
+    "gamma_simulate_f32",
+    "gamma_simulate_into",
     "gamma_tamsd",
+    "gamma_tamsd_curve",
     "gb_central_moment",
     "gb_eatamsd",
     "gb_fpt",
+    "gb_fpt_batch",
     "gb_fpt_central_moment",
     "gb_fpt_raw_moment",
     "gb_frac_central_moment",
     "gb_frac_raw_moment",
     "gb_mean",
+    "gb_moments",
     "gb_msd",
     "gb_occupation_time",
     "gb_occupation_time_central_moment",
@@ -154,6 +175,7 @@ __all__ = [
     "gb_raw_moment",
     "gb_simulate",
     "gb_tamsd",
+    "gb_tamsd_curve",
     "generalized_langevin_central_moment",
     "generalized_langevin_eatamsd",
     "generalized_langevin_fpt",
@@ -299,6 +321,7 @@ __all__ = [
     "uniform_rand_int",
     "uniform_rands_float",
     "uniform_rands_int",
+    "validate_moment_args",
 ]
 
 def asymmetric_cauchy_central_moment(start_position: builtins.float, beta: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int) -> builtins.float:
@@ -596,6 +619,11 @@ def bm_fpt(start_position: builtins.float, diffusion_coefficient: builtins.float
     Get the first passage time of Brownian motion.
     """
 
+def bm_fpt_batch(start_position: builtins.float, diffusion_coefficient: builtins.float, domain: tuple[builtins.float, builtins.float], particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the first passage times of independent Brownian motions, NaN where no passage occurs.
+    """
+
 def bm_fpt_central_moment(start_position: builtins.float, diffusion_coefficient: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[builtins.float]:
     r"""
     Get the central moment of the first passage time of Brownian motion.
@@ -797,30 +825,66 @@ def ctrw_simulate_step(alpha: builtins.float, beta: builtins.float, start_positi
 
 def eatamsd(simulate_fn: typing.Any, duration: builtins.float, delta: builtins.float, particles: builtins.int, time_step: builtins.float, quad_order: builtins.int) -> builtins.float: ...
 
+def ensure_float(value: typing.Any) -> builtins.float:
+    r"""
+    Ensure the input value is a float, converting from int if necessary.
+    """
+
 def exp_rand(scale: builtins.float = 1.0) -> builtins.float: ...
 
 def exp_rands(n: builtins.int, /, scale: builtins.float = 1.0) -> numpy.typing.NDArray[numpy.float64]: ...
 
+def fbm_antithetic_moment(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, central: builtins.bool, particles: builtins.int) -> builtins.float:
+    r"""
+    Get the raw or central moment of FBm from antithetic path pairs.
+
+    Exactly `particles` samples are used: when `particles` is odd, the reflection
+    of the last simulated path is dropped.
+    """
+
 def fbm_central_moment(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int) -> builtins.float:
     r"""
     Get the central moment of FBm.
     """
 
-def fbm_eatamsd(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, delta: builtins.float, particles: builtins.int, time_step: builtins.float, quad_order: builtins.int) -> builtins.float:
+def fbm_eatamsd(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, delta: builtins.float, particles: builtins.int, time_step: builtins.float) -> builtins.float:
     r"""
     Get the effective time-averaged mean squared displacement of FBm.
     """
 
-def fbm_fpt(start_position: builtins.float, hurst_exponent: builtins.float, time_step: builtins.float, domain: tuple[builtins.float, builtins.float], max_duration: builtins.float) -> typing.Optional[builtins.float]:
+def fbm_endpoints(start_position: builtins.float, hurst_exponent: builtins.float, duration: typing.Any, time_step: typing.Any, particles: typing.Any) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Simulate independent FBm paths and return the final position of each.
+    """
+
+def fbm_fpt(start_position: builtins.float, hurst_exponent: builtins.float, time_step: typing.Any, domain: typing.Any, max_duration: typing.Any) -> typing.Optional[builtins.float]:
     r"""
     Get the first passage time of FBm.
     """
 
+def fbm_fpt_batch(start_position: builtins.float, hurst_exponent: builtins.float, domain: typing.Any, particles: typing.Any, time_step: typing.Any, max_duration: typing.Any) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the first passage times of independent FBm paths, NaN where no passage occurs.
+    """
+
 def fbm_fpt_central_moment(start_position: builtins.float, hurst_exponent: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[builtins.float]:
     r"""
     Get the central moment of the first passage time of FBm.
     """
 
+def fbm_fpt_moment_grid(start_position: builtins.float, hurst_exponent: builtins.float, lower: typing.Sequence[builtins.float], upper: typing.Sequence[builtins.float], time_steps: typing.Sequence[builtins.float], order: builtins.int, central: builtins.bool, particles: builtins.int, max_duration: builtins.float) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get a moment of the first passage time of FBm at every point of a grid of
+    domains `(lower[k], upper[k])` and time steps `time_steps[k]`, NaN where some
+    path does not leave the domain.
+    """
+
+def fbm_fpt_moments(start_position: builtins.float, hurst_exponent: builtins.float, domain: tuple[builtins.float, builtins.float], orders: typing.Sequence[builtins.int], particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[tuple[builtins.list[builtins.float], builtins.list[builtins.float]]]:
+    r"""
+    Get the raw and central moments of the first passage time of FBm for every
+    order in `orders`, all from one sample of first passage times.
+    """
+
 def fbm_fpt_raw_moment(start_position: builtins.float, hurst_exponent: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[builtins.float]:
     r"""
     Get the raw moment of the first passage time of FBm.
@@ -841,12 +905,20 @@ def fbm_mean(start_position: builtins.float, hurst_exponent: builtins.float, dur
     Get the mean of FBm.
     """
 
+def fbm_mean_msd(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float) -> tuple[builtins.float, builtins.float]:
+    r"""
+    Get the mean and the msd of FBm from a single ensemble.
+
+    Each particle contributes its displacement and squared displacement to one
+    parallel reduction, so both statistics cost one set of simulations.
+    """
+
 def fbm_msd(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float) -> builtins.float:
     r"""
     Get the msd of FBm.
     """
 
-def fbm_occupation_time(start_position: builtins.float, hurst_exponent: builtins.float, time_step: builtins.float, domain: tuple[builtins.float, builtins.float], duration: builtins.float) -> builtins.float:
+def fbm_occupation_time(start_position: builtins.float, hurst_exponent: builtins.float, time_step: typing.Any, domain: typing.Any, duration: typing.Any) -> builtins.float:
     r"""
     Get the occupation time of FBm.
     """
@@ -866,22 +938,45 @@ def fbm_raw_moment(start_position: builtins.float, hurst_exponent: builtins.floa
     Get the raw moment of FBm.
     """
 
-def fbm_simulate(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, time_step: builtins.float) -> tuple[numpy.typing.NDArray[numpy.float64], numpy.typing.NDArray[numpy.float64]]:
+def fbm_simulate(start_position: builtins.float, hurst_exponent: builtins.float, duration: typing.Any, time_step: typing.Any) -> tuple[numpy.typing.NDArray[numpy.float64], numpy.typing.NDArray[numpy.float64]]:
     r"""
     Simulate FBm.
     """
 
-def fbm_tamsd(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, delta: builtins.float, time_step: builtins.float, quad_order: builtins.int) -> builtins.float:
+def fbm_simulate_batch(start_position: builtins.float, hurst_exponent: builtins.float, duration: typing.Any, time_step: typing.Any, particles: typing.Any) -> tuple[numpy.typing.NDArray[numpy.float64], numpy.typing.NDArray[numpy.float64]]:
+    r"""
+    Simulate independent FBm paths, returning the shared times and one row of positions per particle.
+    """
+
+def fbm_simulate_batch_f32(start_position: builtins.float, hurst_exponent: builtins.float, duration: typing.Any, time_step: typing.Any, particles: typing.Any) -> tuple[numpy.typing.NDArray[numpy.float32], numpy.typing.NDArray[numpy.float32]]:
+    r"""
+    Simulate independent FBm paths, returning single-precision times and positions.
+
+    Each path is generated in double precision and narrowed row by row, so the
+    full double-precision matrix is never materialised.
+    """
+
+def fbm_simulate_f32(start_position: builtins.float, hurst_exponent: builtins.float, duration: typing.Any, time_step: typing.Any) -> tuple[numpy.typing.NDArray[numpy.float32], numpy.typing.NDArray[numpy.float32]]:
+    r"""
+    Simulate FBm, returning single-precision times and positions.
+    """
+
+def fbm_tamsd(start_position: builtins.float, hurst_exponent: builtins.float, duration: builtins.float, delta: builtins.float, time_step: builtins.float) -> builtins.float:
     r"""
     Get the time-averaged mean squared displacement of FBm.
     """
 
-def gamma_central_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int) -> builtins.float:
+def fbm_validate_params(start_position: typing.Any, hurst_exponent: typing.Any) -> tuple[builtins.float, builtins.float]:
+    r"""
+    Validate and convert the FBm constructor parameters.
+    """
+
+def gamma_central_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the central moment of Gamma.
     """
 
-def gamma_eatamsd(shape: builtins.float, rate: builtins.float, duration: builtins.float, delta: builtins.float, particles: builtins.int, time_step: builtins.float, quad_order: builtins.int) -> builtins.float:
+def gamma_eatamsd(shape: builtins.float, rate: builtins.float, duration: builtins.float, delta: builtins.float, particles: builtins.int, time_step: builtins.float, quad_order: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the effective time-averaged mean squared displacement of Gamma.
     """
@@ -891,32 +986,69 @@ def gamma_fpt(shape: builtins.float, rate: builtins.float, time_step: builtins.f
     Get the first passage time of Gamma.
     """
 
-def gamma_fpt_central_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[builtins.float]:
+def gamma_fpt_batch(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the first passage times of independent Gamma processes, NaN where no passage occurs.
+    """
+
+def gamma_fpt_bridge(shape: builtins.float, rate: builtins.float, time_step: builtins.float, domain: tuple[builtins.float, builtins.float], max_duration: builtins.float) -> typing.Optional[builtins.float]:
+    r"""
+    Get the first passage time of Gamma without stepping through the whole grid.
+
+    The path is advanced in coarse steps of `BRIDGE_COARSE_STEPS` time steps until
+    it leaves the domain. The crossing is then located to within `time_step` by
+    bisection: given the values at both ends of an interval, the value at its
+    midpoint follows the gamma bridge, a Beta-distributed split of the increment.
+    The result has the same law and resolution as the fine-grid search, with
+    work proportional to the number of coarse steps plus the bisection depth.
+    """
+
+def gamma_fpt_central_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> typing.Optional[builtins.float]:
     r"""
     Get the central moment of the first passage time of Gamma.
     """
 
-def gamma_fpt_raw_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[builtins.float]:
+def gamma_fpt_raw_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float, n_threads: typing.Optional[builtins.int] = None, tol: typing.Optional[builtins.float] = None) -> typing.Optional[builtins.float]:
     r"""
     Get the raw moment of the first passage time of Gamma.
+
+    With `tol`, particles are drawn in batches and sampling stops once the
+    standard error of the estimate falls below `tol` times its magnitude, checked
+    only after at least `ADAPTIVE_MIN_PARTICLES` particles and using at most
+    `particles` particles.
     """
 
-def gamma_frac_central_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int) -> builtins.float:
+def gamma_frac_central_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the fractional central moment of Gamma.
     """
 
-def gamma_frac_raw_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int) -> builtins.float:
+def gamma_frac_raw_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the fractional raw moment of Gamma.
     """
 
-def gamma_mean(shape: builtins.float, rate: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float) -> builtins.float:
+def gamma_mean(shape: builtins.float, rate: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the mean of Gamma.
     """
 
-def gamma_msd(shape: builtins.float, rate: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float) -> builtins.float:
+def gamma_moments(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, orders: typing.Sequence[builtins.int], central: builtins.bool, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the raw or central moments of Gamma for every order in `orders`, all from
+    one ensemble of `particles` simulated positions at `duration`.
+    """
+
+def gamma_moments_over_durations(shape: builtins.float, rate: builtins.float, durations: typing.Sequence[builtins.float], time_step: builtins.float, order: builtins.int, central: builtins.bool, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the raw or central moment of Gamma at every time in `durations`.
+
+    Each particle is simulated once up to the longest duration, and its position
+    at every shorter duration is read off the same path. The durations are expected
+    to be whole multiples of `time_step`, so each one falls on a sample.
+    """
+
+def gamma_msd(shape: builtins.float, rate: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the msd of Gamma.
     """
@@ -926,17 +1058,17 @@ def gamma_occupation_time(shape: builtins.float, rate: builtins.float, domain: t
     Get the occupation time of Gamma.
     """
 
-def gamma_occupation_time_central_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float) -> builtins.float:
+def gamma_occupation_time_central_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the central moment of the occupation time of Gamma.
     """
 
-def gamma_occupation_time_raw_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float) -> builtins.float:
+def gamma_occupation_time_raw_moment(shape: builtins.float, rate: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the raw moment of the occupation time of Gamma.
     """
 
-def gamma_raw_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int) -> builtins.float:
+def gamma_raw_moment(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the raw moment of Gamma.
     """
@@ -946,17 +1078,35 @@ def gamma_simulate(shape: builtins.float, rate: builtins.float, duration: builti
     Simulate Gamma.
     """
 
+def gamma_simulate_f32(shape: builtins.float, rate: builtins.float, duration: builtins.float, time_step: builtins.float) -> tuple[numpy.typing.NDArray[numpy.float32], numpy.typing.NDArray[numpy.float32]]:
+    r"""
+    Simulate Gamma, returning single-precision times and positions.
+    """
+
+def gamma_simulate_into(shape: builtins.float, rate: builtins.float, out_times: numpy.typing.NDArray[numpy.float64], out_positions: numpy.typing.NDArray[numpy.float64], duration: builtins.float, time_step: builtins.float) -> builtins.int:
+    r"""
+    Simulate Gamma into the caller's `out_times` and `out_positions` buffers and
+    return the number of samples written. Entries past that count are left as
+    they were.
+    """
+
 def gamma_tamsd(shape: builtins.float, rate: builtins.float, duration: builtins.float, delta: builtins.float, time_step: builtins.float, quad_order: builtins.int) -> builtins.float:
     r"""
     Get the time-averaged mean squared displacement of Gamma.
     """
 
-def gb_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int) -> builtins.float:
+def gamma_tamsd_curve(shape: builtins.float, rate: builtins.float, duration: builtins.float, deltas: typing.Sequence[builtins.float], time_step: builtins.float) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the time-averaged mean squared displacement of Gamma at every lag in
+    `deltas`, all from one simulated path.
+    """
+
+def gb_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the central moment of Geometric Brownian Motion.
     """
 
-def gb_eatamsd(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, delta: builtins.float, particles: builtins.int, time_step: builtins.float, quad_order: builtins.int) -> builtins.float:
+def gb_eatamsd(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, delta: builtins.float, particles: builtins.int, time_step: builtins.float, quad_order: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the effective time-averaged mean squared displacement of Geometric Brownian Motion.
     """
@@ -966,32 +1116,43 @@ def gb_fpt(start_position: builtins.float, mu: builtins.float, sigma: builtins.f
     Get the first passage time of Geometric Brownian Motion.
     """
 
-def gb_fpt_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[builtins.float]:
+def gb_fpt_batch(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the first passage times of independent Geometric Brownian Motions, NaN where no passage occurs.
+    """
+
+def gb_fpt_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> typing.Optional[builtins.float]:
     r"""
     Get the central moment of the first passage time of Geometric Brownian Motion.
     """
 
-def gb_fpt_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float) -> typing.Optional[builtins.float]:
+def gb_fpt_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, max_duration: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> typing.Optional[builtins.float]:
     r"""
     Get the raw moment of the first passage time of Geometric Brownian Motion.
     """
 
-def gb_frac_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int) -> builtins.float:
+def gb_frac_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the fractional central moment of Geometric Brownian Motion.
     """
 
-def gb_frac_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int) -> builtins.float:
+def gb_frac_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.float, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the fractional raw moment of Geometric Brownian Motion.
     """
 
-def gb_mean(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float) -> builtins.float:
+def gb_mean(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the mean of Geometric Brownian Motion.
     """
 
-def gb_msd(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float) -> builtins.float:
+def gb_moments(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, orders: typing.Sequence[builtins.int], central: builtins.bool, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the raw or central moments of Geometric Brownian Motion for every order in
+    `orders`, all from one ensemble of `particles` simulated positions at `duration`.
+    """
+
+def gb_msd(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, particles: builtins.int, time_step: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the msd of Geometric Brownian Motion.
     """
@@ -1001,17 +1162,17 @@ def gb_occupation_time(start_position: builtins.float, mu: builtins.float, sigma
     Get the occupation time of Geometric Brownian Motion.
     """
 
-def gb_occupation_time_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float) -> builtins.float:
+def gb_occupation_time_central_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the central moment of the occupation time of Geometric Brownian Motion.
     """
 
-def gb_occupation_time_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float) -> builtins.float:
+def gb_occupation_time_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, domain: tuple[builtins.float, builtins.float], order: builtins.int, particles: builtins.int, time_step: builtins.float, duration: builtins.float, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the raw moment of the occupation time of Geometric Brownian Motion.
     """
 
-def gb_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int) -> builtins.float:
+def gb_raw_moment(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, time_step: builtins.float, order: builtins.int, particles: builtins.int, n_threads: typing.Optional[builtins.int] = None) -> builtins.float:
     r"""
     Get the raw moment of Geometric Brownian Motion.
     """
@@ -1026,6 +1187,12 @@ def gb_tamsd(start_position: builtins.float, mu: builtins.float, sigma: builtins
     Get the time-averaged mean squared displacement of Geometric Brownian Motion.
     """
 
+def gb_tamsd_curve(start_position: builtins.float, mu: builtins.float, sigma: builtins.float, duration: builtins.float, deltas: typing.Sequence[builtins.float], time_step: builtins.float) -> numpy.typing.NDArray[numpy.float64]:
+    r"""
+    Get the time-averaged mean squared displacement of Geometric Brownian Motion at
+    every lag in `deltas`, all from one simulated path.
+    """
+
 def generalized_langevin_central_moment(drift_func: typing.Any, diffusion_func: typing.Any, start_position: builtins.float, alpha: builtins.float, duration: builtins.float, order: builtins.int, particles: builtins.int, time_step: builtins.float) -> builtins.float:
     r"""
     Get the central moment of GeneralizedLangevin process.
@@ -1703,3 +1870,8 @@ def uniform_rands_float(n: builtins.int, /, low: builtins.float = 0.0, high: bui
 
 def uniform_rands_int(n: builtins.int, low: builtins.int, high: builtins.int, /, end: builtins.bool = False) -> numpy.typing.NDArray[numpy.int64]: ...
 
+def validate_moment_args(order: typing.Any, central: typing.Any, particles: typing.Any, time_step: typing.Any, duration: typing.Any, domain: typing.Optional[typing.Any] = None, duration_name: builtins.str = "duration", process_name: builtins.str = "") -> tuple[typing.Any, builtins.bool, builtins.int, builtins.float, builtins.float, typing.Optional[tuple[builtins.float, builtins.float]]]:
+    r"""
+    Validate the arguments shared by the moment estimators in one call.
+    """
+
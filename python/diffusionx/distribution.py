@@ -1,12 +1,11 @@
 from math import isfinite
-from typing import Union
 
 import numpy as np
 
 from . import random
 from .types import DType
 
-real = Union[float, int]
+real = float | int
 
 
 def _ensure_real(value: real, name: str) -> float:
@@ -1,12 +1,12 @@
 from math import isfinite
-from typing import Callable, Union
+from typing import Callable
 
 import numpy as np
 
 from . import _core
 from .types import DType
 
-real = Union[float, int]
+real = float | int
 
 
 def _check_all_uint(size: tuple[int, ...]) -> bool:
@@ -31,10 +31,10 @@ def _ensure_integer(value: real, name: str) -> int:
 
 def _generate_random_values(
     size: int | tuple[int, ...],
-    single_val_generator: Callable[..., Union[float, int, bool]],
+    single_val_generator: Callable[..., float | int | bool],
     array_generator: Callable[..., np.ndarray],
     func_args: tuple,
-) -> Union[float, int, bool, np.ndarray]:
+) -> float | int | bool | np.ndarray:
     """Helper function to generate single or multiple random values based on size."""
     if isinstance(size, int) and not isinstance(size, bool):
         if size == 1:
@@ -61,7 +61,7 @@ def _generate_random_values(
 
 def randexp(
     size: int | tuple[int, ...] = 1, scale: real = 1.0
-) -> Union[float, np.ndarray]:
+) -> float | np.ndarray:
     """
     Exponential distribution random numbers
 
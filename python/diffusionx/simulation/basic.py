@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Annotated, Literal, Union
+from typing import Annotated, Literal
 
 import numpy as np
 import numpy.typing as npt
@@ -12,8 +12,9 @@ from .utils import (
     validate_positive_integer,
 )
 
-real = Union[int, float]
+real = int | float
 Vector = Annotated[npt.NDArray[np.float64], Literal["N"]]
+Matrix = Annotated[npt.NDArray[np.float64], Literal["M", "N"]]
 
 
 class ContinuousProcess(ABC):
@@ -2,7 +2,6 @@ from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -28,7 +27,7 @@ class Bm:
         self.diffusion_coefficient: float = validate_positive_float(
             diffusion_coefficient, "diffusion_coefficient"
         )
-        self.start_position: float = ensure_float(start_position)
+        self.start_position: float = _core.ensure_float(start_position)
 
     def simulate(
         self, duration: real, time_step: float = 0.01
@@ -151,6 +150,39 @@ class Bm:
             max_duration,
         )
 
+    def fpt_batch(
+        self,
+        domain: tuple[real, real],
+        particles: int = 10_000,
+        max_duration: real = 1000,
+        time_step: float = 0.01,
+    ) -> Vector:
+        """
+        Calculate the first passage times of independent Brownian motions.
+
+        Args:
+            domain (tuple[real, real]): The domain (a, b) for FPT. a must be less than b.
+            particles (int, optional): Number of paths (positive integer). Defaults to 10_000.
+            max_duration (real, optional): Maximum duration to simulate for FPT. Defaults to 1000.
+            time_step (real, optional): Step size for the simulation. Defaults to 0.01.
+
+        Returns:
+            np.ndarray: The first passage time of each path, NaN where max_duration is reached first.
+        """
+        a, b = validate_domain(domain, process_name="Bm FPT batch")
+        particles = validate_particles(particles)
+        time_step = validate_positive_float(time_step, "time_step")
+        max_duration = validate_positive_float(max_duration, "max_duration")
+
+        return _core.bm_fpt_batch(
+            self.start_position,
+            self.diffusion_coefficient,
+            (a, b),
+            particles,
+            time_step,
+            max_duration,
+        )
+
     def fpt_moment(
         self,
         domain: tuple[real, real],
@@ -2,7 +2,6 @@ from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -23,7 +22,7 @@ class Cauchy:
         Args:
             start_position (real, optional): Starting position. Defaults to 0.0.
         """
-        self.start_position: float = ensure_float(start_position)
+        self.start_position: float = _core.ensure_float(start_position)
 
     def simulate(
         self,
@@ -354,8 +353,8 @@ class AsymmetricCauchy:
             beta (real, optional): Skewness parameter. Must be in [-1, 1]. Defaults to 0.0 (symmetric Cauchy).
             start_position (real, optional): Starting position. Defaults to 0.0.
         """
-        beta = ensure_float(beta)
-        start_position = ensure_float(start_position)
+        beta = _core.ensure_float(beta)
+        start_position = _core.ensure_float(start_position)
         if not (-1 <= beta <= 1):
             raise ValueError(
                 f"beta (skewness) must be in the range [-1, 1], got {beta}"
@@ -2,7 +2,6 @@ from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -29,7 +28,7 @@ class CTRW:
         """
         self.alpha: float = validate_positive_float(alpha, "alpha")
         self.beta: float = validate_positive_float(beta, "beta")
-        self.start_position: float = ensure_float(start_position)
+        self.start_position: float = _core.ensure_float(start_position)
 
         if not (self.alpha <= 1):
             raise ValueError(f"alpha must be in the range (0, 1], got {self.alpha}")
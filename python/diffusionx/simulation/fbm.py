@@ -1,18 +1,73 @@
-from diffusionx import _core
+import warnings
+
+import numpy as np
+import numpy.typing as npt
+
+from diffusionx._core import (
+    fbm_antithetic_moment,
+    fbm_central_moment,
+    fbm_eatamsd,
+    fbm_endpoints,
+    fbm_fpt,
+    fbm_fpt_batch,
+    fbm_fpt_central_moment,
+    fbm_fpt_moment_grid,
+    fbm_fpt_moments,
+    fbm_fpt_raw_moment,
+    fbm_frac_central_moment,
+    fbm_frac_raw_moment,
+    fbm_mean,
+    fbm_mean_msd,
+    fbm_msd,
+    fbm_occupation_time,
+    fbm_occupation_time_central_moment,
+    fbm_occupation_time_raw_moment,
+    fbm_raw_moment,
+    fbm_simulate,
+    fbm_simulate_batch,
+    fbm_simulate_batch_f32,
+    fbm_simulate_f32,
+    fbm_tamsd,
+    fbm_validate_params,
+    validate_moment_args,
+)
 
-from .basic import Vector, real
+from .basic import Matrix, Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
     validate_particles,
     validate_positive_float,
-    validate_positive_integer,
 )
 
 
+# Native moment estimators indexed by `central`, and for ensemble moments by
+# whether the order is an integer, so each call is a single lookup.
+_MOMENT_FNS = {
+    (True, False): fbm_raw_moment,
+    (True, True): fbm_central_moment,
+    (False, False): fbm_frac_raw_moment,
+    (False, True): fbm_frac_central_moment,
+}
+_FPT_MOMENT_FNS = (fbm_fpt_raw_moment, fbm_fpt_central_moment)
+_OCCUPATION_TIME_MOMENT_FNS = (
+    fbm_occupation_time_raw_moment,
+    fbm_occupation_time_central_moment,
+)
+
+
+def _warn_quad_order() -> None:
+    warnings.warn(
+        "quad_order is deprecated and ignored: the FBm TAMSD is an exact sum over the sampled path",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
 class FBm:
+    __slots__ = ("_args",)
+
     def __init__(
         self,
         start_position: real = 0.0,
@@ -25,18 +80,27 @@ class FBm:
             start_position (real, optional): The starting position. Defaults to 0.0.
             hurst_exponent (real, optional): The Hurst exponent. Must be in (0, 1). Defaults to 0.5.
         """
-        start_position = ensure_float(start_position)
-        hurst_exponent = ensure_float(hurst_exponent)
-        if not (0 < hurst_exponent < 1):
-            raise ValueError(
-                f"hurst_exponent must be in the range (0, 1), got {hurst_exponent}"
-            )
+        start_position, hurst_exponent = fbm_validate_params(
+            start_position, hurst_exponent
+        )
+
+        self._args: tuple[float, float] = (start_position, hurst_exponent)
+
+    @property
+    def start_position(self) -> float:
+        """The starting position."""
+        return self._args[0]
 
-        self.start_position: float = start_position
-        self.hurst_exponent: float = hurst_exponent
+    @property
+    def hurst_exponent(self) -> float:
+        """The Hurst exponent."""
+        return self._args[1]
 
     def simulate(
-        self, duration: real, time_step: float = 0.01
+        self,
+        duration: real,
+        time_step: float = 0.01,
+        dtype: npt.DTypeLike = np.float64,
     ) -> tuple[Vector, Vector]:
         """
         Simulate the fractional Brownian motion.
@@ -44,18 +108,89 @@ class FBm:
         Args:
             duration (real): Total duration of the simulation.
             time_step (real, optional): Step size for the simulation. Defaults to 0.01.
+            dtype (DTypeLike, optional): Precision of the returned arrays, float64 or float32.
+                The path is always generated in float64. Defaults to np.float64.
 
         Returns:
             tuple[np.ndarray, np.ndarray]: Times and positions of the FBM.
         """
-        duration = validate_positive_float(duration, "duration")
-        time_step = validate_positive_float(time_step, "time_step")
+        if dtype is not np.float64:
+            dtype = np.dtype(dtype)
+            if dtype == np.float32:
+                return fbm_simulate_f32(
+                    *self._args,
+                    duration,
+                    time_step,
+                )
+            if dtype != np.float64:
+                raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+
+        return fbm_simulate(
+            *self._args,
+            duration,
+            time_step,
+        )
+
+    def simulate_batch(
+        self,
+        duration: real,
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> tuple[Vector, Matrix]:
+        """
+        Simulate independent paths of the fractional Brownian motion.
+
+        Args:
+            duration (real): Total duration of the simulation.
+            particles (int, optional): Number of paths (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size for the simulation. Defaults to 0.01.
+            dtype (DTypeLike, optional): Precision of the returned arrays, float64 or float32.
+                Paths are generated in float64 and narrowed as they are stored, which halves
+                the memory of the position matrix. Promote to float64 before reducing over
+                many paths. Defaults to np.float64.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Times, and positions with one row per path.
+        """
+        if dtype is not np.float64:
+            dtype = np.dtype(dtype)
+            if dtype == np.float32:
+                return fbm_simulate_batch_f32(
+                    *self._args,
+                    duration,
+                    time_step,
+                    particles,
+                )
+            if dtype != np.float64:
+                raise ValueError(f"dtype must be float32 or float64, got {dtype}")
 
-        return _core.fbm_simulate(
-            self.start_position,
-            self.hurst_exponent,
+        return fbm_simulate_batch(
+            *self._args,
             duration,
             time_step,
+            particles,
+        )
+
+    def endpoints(
+        self, duration: real, particles: int = 10_000, time_step: float = 0.01
+    ) -> Vector:
+        """
+        Simulate independent paths and return the final position of each.
+
+        Args:
+            duration (real): Total duration of the simulation.
+            particles (int, optional): Number of paths (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size for the simulation. Defaults to 0.01.
+
+        Returns:
+            np.ndarray: The position of each path at `duration`.
+        """
+        return fbm_endpoints(
+            *self._args,
+            duration,
+            time_step,
+            particles,
         )
 
     def fpt(
@@ -75,15 +210,37 @@ class FBm:
         Returns:
             Optional[float]: The FPT, or None if max_duration reached first.
         """
-        a, b = validate_domain(domain, process_name="Fbm FPT")
-        time_step = validate_positive_float(time_step, "time_step")
-        max_duration = validate_positive_float(max_duration, "max_duration")
+        return fbm_fpt(
+            *self._args,
+            time_step,
+            domain,
+            max_duration,
+        )
 
-        return _core.fbm_fpt(
-            self.start_position,
-            self.hurst_exponent,
+    def fpt_batch(
+        self,
+        domain: tuple[real, real],
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        max_duration: real = 1000,
+    ) -> Vector:
+        """
+        Calculate the first passage times of independent FBM paths.
+
+        Args:
+            domain (tuple[real, real]): Domain (a, b) for FPT. a must be less than b.
+            particles (int, optional): Number of paths (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            max_duration (real, optional): Maximum simulation duration for FPT. Defaults to 1000.
+
+        Returns:
+            np.ndarray: The FPT of each path, NaN where max_duration was reached first.
+        """
+        return fbm_fpt_batch(
+            *self._args,
+            domain,
+            particles,
             time_step,
-            (a, b),
             max_duration,
         )
 
@@ -96,36 +253,140 @@ class FBm:
         time_step: float = 0.01,
         max_duration: real = 1000,
     ) -> float | None:
-        validate_bool(central, "central")
-        validate_order(order)
-        a, b = validate_domain(domain, process_name="Fbm FPT raw moment")
-        particles = validate_particles(particles)
-        time_step = validate_positive_float(time_step, "time_step")
-        max_duration = validate_positive_float(max_duration, "max_duration")
-
-        result = (
-            _core.fbm_fpt_raw_moment(
-                self.start_position,
-                self.hurst_exponent,
-                (a, b),
-                order,
-                particles,
-                time_step,
-                max_duration,
-            )
-            if not central
-            else _core.fbm_fpt_central_moment(
-                self.start_position,
-                self.hurst_exponent,
-                (a, b),
+        order, central, particles, time_step, max_duration, (a, b) = (
+            validate_moment_args(
                 order,
+                central,
                 particles,
                 time_step,
                 max_duration,
+                domain,
+                "max_duration",
+                "Fbm FPT raw moment",
             )
         )
 
-        return result
+        return _FPT_MOMENT_FNS[central](
+            *self._args,
+            (a, b),
+            order,
+            particles,
+            time_step,
+            max_duration,
+        )
+
+    def fpt_moments(
+        self,
+        domain: tuple[real, real],
+        orders: tuple[int, ...] = (1, 2, 3, 4),
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        max_duration: real = 1000,
+    ) -> dict[tuple[str, int], float] | None:
+        """
+        Calculate raw and central moments of the FPT for several orders from one sample.
+
+        The first passage times are simulated once and every requested moment is
+        reduced from the same sample, so asking for the mean, variance, skewness and
+        kurtosis costs one set of simulations instead of one per moment.
+
+        Args:
+            domain (tuple[real, real]): Domain (a, b) for FPT. a must be less than b.
+            orders (tuple[int, ...], optional): Moment orders (non-negative integers). Defaults to (1, 2, 3, 4).
+            particles (int, optional): Number of particles (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            max_duration (real, optional): Maximum simulation duration for FPT. Defaults to 1000.
+
+        Returns:
+            Optional[dict[tuple[str, int], float]]: Moments keyed by ("raw", order) and
+                ("central", order), or None if some particle did not leave the domain
+                before max_duration.
+        """
+        a, b = validate_domain(domain, process_name="Fbm FPT moments")
+        orders = tuple(orders)
+        for order in orders:
+            validate_order(order)
+            if not isinstance(order, int):
+                raise TypeError(
+                    f"order must be an integer, got {type(order).__name__}"
+                )
+        particles = validate_particles(particles)
+        time_step = validate_positive_float(time_step, "time_step")
+        max_duration = validate_positive_float(max_duration, "max_duration")
+
+        result = fbm_fpt_moments(
+            *self._args,
+            (a, b),
+            list(orders),
+            particles,
+            time_step,
+            max_duration,
+        )
+        if result is None:
+            return None
+        raw, central = result
+        moments = {("raw", order): value for order, value in zip(orders, raw)}
+        moments.update(
+            (("central", order), value) for order, value in zip(orders, central)
+        )
+        return moments
+
+    def fpt_moment_grid(
+        self,
+        lower: npt.ArrayLike,
+        upper: npt.ArrayLike,
+        time_step: npt.ArrayLike = 0.01,
+        order: int = 1,
+        central: bool = False,
+        particles: int = 10_000,
+        max_duration: real = 1000,
+    ) -> np.ndarray:
+        """
+        Calculate a moment of the FPT at every point of a grid of domains and step sizes.
+
+        `lower`, `upper` and `time_step` are broadcast against each other, so the
+        output of `np.meshgrid` can be passed directly. The whole grid is estimated in
+        one native call, with the grid points run in parallel.
+
+        Args:
+            lower (ArrayLike): Lower bound a of each domain.
+            upper (ArrayLike): Upper bound b of each domain. Must exceed `lower`.
+            time_step (ArrayLike, optional): Step size at each point. Defaults to 0.01.
+            order (int, optional): Order of the moment (non-negative integer). Defaults to 1.
+            central (bool, optional): Whether to calculate the central moment. Defaults to False.
+            particles (int, optional): Number of particles (positive integer) per point. Defaults to 10_000.
+            max_duration (real, optional): Maximum simulation duration for FPT. Defaults to 1000.
+
+        Returns:
+            np.ndarray: The moment at each grid point, NaN where some particle did not
+                leave the domain before max_duration.
+        """
+        validate_bool(central, "central")
+        validate_order(order)
+        if not isinstance(order, int):
+            raise TypeError(f"order must be an integer, got {type(order).__name__}")
+        particles = validate_particles(particles)
+        max_duration = validate_positive_float(max_duration, "max_duration")
+        lower, upper, time_step = np.broadcast_arrays(
+            np.asarray(lower, dtype=np.float64),
+            np.asarray(upper, dtype=np.float64),
+            np.asarray(time_step, dtype=np.float64),
+        )
+        if not np.all(lower < upper):
+            raise ValueError("every domain must satisfy lower < upper")
+        if not np.all((time_step > 0) & np.isfinite(time_step)):
+            raise ValueError("time_step must be positive and finite")
+
+        return fbm_fpt_moment_grid(
+            *self._args,
+            lower.ravel().tolist(),
+            upper.ravel().tolist(),
+            time_step.ravel().tolist(),
+            order,
+            central,
+            particles,
+            max_duration,
+        ).reshape(lower.shape)
 
     def moment(
         self,
@@ -134,6 +395,7 @@ class FBm:
         central: bool = False,
         particles: int = 10_000,
         time_step: float = 0.01,
+        antithetic: bool = False,
     ) -> float:
         """
         Calculate the raw moment of the FBM.
@@ -143,56 +405,44 @@ class FBm:
             order (int | float): Moment order (integer or float).
             particles (int): Number of particles (positive integer).
             time_step (real, optional): Step size. Defaults to 0.01.
+            antithetic (bool, optional): Pair every path with its reflection about the
+                starting position, simulating half as many paths. With an odd particle
+                count the last reflection is dropped. Integer orders only.
+                Defaults to False.
 
         Returns:
             float: The raw moment.
         """
-        validate_bool(central, "central")
-        validate_order(order)
-        particles = validate_particles(particles)
-        duration = validate_positive_float(duration, "duration")
-        time_step = validate_positive_float(time_step, "time_step")
-
-        return (
-            (
-                _core.fbm_raw_moment(
-                    self.start_position,
-                    self.hurst_exponent,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-                if not central
-                else _core.fbm_central_moment(
-                    self.start_position,
-                    self.hurst_exponent,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-            )
-            if isinstance(order, int)
-            else (
-                _core.fbm_frac_raw_moment(
-                    self.start_position,
-                    self.hurst_exponent,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-                if not central
-                else _core.fbm_frac_central_moment(
-                    self.start_position,
-                    self.hurst_exponent,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
+        order, central, particles, time_step, duration, _ = validate_moment_args(
+            order, central, particles, time_step, duration
+        )
+        validate_bool(antithetic, "antithetic")
+        if order == 0:
+            return 1.0
+        if central and order == 1:
+            return 0.0
+        if antithetic:
+            if not isinstance(order, int):
+                raise TypeError(
+                    f"antithetic sampling requires an integer order, got {type(order).__name__}"
                 )
+            if central and order % 2 == 1:
+                return 0.0
+            return fbm_antithetic_moment(
+                *self._args,
+                duration,
+                time_step,
+                order,
+                central,
+                particles,
             )
+
+        return _MOMENT_FNS[isinstance(order, int), central](
+            *self._args,
+            duration,
+            time_step,
+            order,
+            particles,
         )
 
     def occupation_time(
@@ -204,6 +454,9 @@ class FBm:
         """
         Calculate the occupation time of the FBM in a domain.
 
+        A new path is simulated; use `occupation_time_from_path` to measure a path
+        already returned by `simulate`.
+
         Args:
             domain (tuple[real, real]): Domain (a, b). a must be less than b.
             duration (real): Total simulation duration.
@@ -212,18 +465,39 @@ class FBm:
         Returns:
             float: Occupation time.
         """
-        a, b = validate_domain(domain, process_name="Fbm Occupation Time")
-        duration = validate_positive_float(duration, "duration")
-        time_step = validate_positive_float(time_step, "time_step")
-
-        return _core.fbm_occupation_time(
-            self.start_position,
-            self.hurst_exponent,
+        return fbm_occupation_time(
+            *self._args,
             time_step,
-            (a, b),
+            domain,
             duration,
         )
 
+    @staticmethod
+    def occupation_time_from_path(
+        path: tuple[Vector, Vector], domain: tuple[real, real]
+    ) -> float:
+        """
+        Calculate the occupation time of an already simulated path in a domain.
+
+        Args:
+            path (tuple[np.ndarray, np.ndarray]): Times and positions, as returned by `simulate`.
+            domain (tuple[real, real]): Domain (a, b). a must be less than b.
+
+        Returns:
+            float: Occupation time, as a left Riemann sum over the steps of the path.
+        """
+        a, b = validate_domain(domain, process_name="Fbm Occupation Time")
+        times, positions = path
+        times = np.asarray(times, dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64)
+        if times.shape != positions.shape or times.ndim != 1:
+            raise ValueError(
+                "path must be a pair of one-dimensional arrays of the same length"
+            )
+        left = positions[:-1]
+        inside = (left > a) & (left < b)
+        return float(np.diff(times)[inside].sum())
+
     def occupation_time_moment(
         self,
         domain: tuple[real, real],
@@ -233,56 +507,61 @@ class FBm:
         particles: int = 10_000,
         time_step: float = 0.01,
     ) -> float:
-        validate_bool(central, "central")
-        validate_order(order)
-        a, b = validate_domain(domain, process_name="Fbm Occupation raw moment")
-        particles = validate_particles(particles)
-        duration = validate_positive_float(duration, "duration")
-        time_step = validate_positive_float(time_step, "time_step")
-
-        result = (
-            _core.fbm_occupation_time_raw_moment(
-                self.start_position,
-                self.hurst_exponent,
-                (a, b),
-                order,
-                particles,
-                time_step,
-                duration,
-            )
-            if not central
-            else _core.fbm_occupation_time_central_moment(
-                self.start_position,
-                self.hurst_exponent,
-                (a, b),
+        order, central, particles, time_step, duration, (a, b) = (
+            validate_moment_args(
                 order,
+                central,
                 particles,
                 time_step,
                 duration,
+                domain,
+                process_name="Fbm Occupation raw moment",
             )
         )
+        if order == 0:
+            return 1.0
+        if central and order == 1:
+            return 0.0
 
-        return result
+        return _OCCUPATION_TIME_MOMENT_FNS[central](
+            *self._args,
+            (a, b),
+            order,
+            particles,
+            time_step,
+            duration,
+        )
 
     def tamsd(
         self,
         duration: real,
         delta: real,
         time_step: float = 0.01,
-        quad_order: int = 10,
+        quad_order: int | None = None,
     ) -> float:
+        """
+        Calculate the time-averaged mean squared displacement of one FBM path.
+
+        Args:
+            duration (real): Simulation duration.
+            delta (real): Lag time, rounded to a whole number of steps.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            quad_order (int, optional): Deprecated and ignored; the average is an exact sum over the samples.
+
+        Returns:
+            float: The TAMSD.
+        """
         duration = validate_positive_float(duration, "duration")
         delta = validate_positive_float(delta, "delta")
         time_step = validate_positive_float(time_step, "time_step")
-        quad_order = validate_positive_integer(quad_order, "quad_order")
+        if quad_order is not None:
+            _warn_quad_order()
 
-        return _core.fbm_tamsd(
-            self.start_position,
-            self.hurst_exponent,
+        return fbm_tamsd(
+            *self._args,
             duration,
             delta,
             time_step,
-            quad_order,
         )
 
     def eatamsd(
@@ -291,22 +570,34 @@ class FBm:
         delta: real,
         particles: int = 10_000,
         time_step: float = 0.01,
-        quad_order: int = 10,
+        quad_order: int | None = None,
     ) -> float:
+        """
+        Calculate the ensemble-averaged TAMSD of the FBM.
+
+        Args:
+            duration (real): Simulation duration.
+            delta (real): Lag time, rounded to a whole number of steps.
+            particles (int, optional): Number of particles (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            quad_order (int, optional): Deprecated and ignored; the average is an exact sum over the samples.
+
+        Returns:
+            float: The EATAMSD.
+        """
         duration = validate_positive_float(duration, "duration")
         delta = validate_positive_float(delta, "delta")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
-        quad_order = validate_positive_integer(quad_order, "quad_order")
+        if quad_order is not None:
+            _warn_quad_order()
 
-        return _core.fbm_eatamsd(
-            self.start_position,
-            self.hurst_exponent,
+        return fbm_eatamsd(
+            *self._args,
             duration,
             delta,
             particles,
             time_step,
-            quad_order,
         )
 
     def mean(
@@ -327,12 +618,11 @@ class FBm:
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
 
-        return _core.fbm_mean(
-            self.start_position,
-            self.hurst_exponent,
+        return fbm_mean(
+            *self._args,
             duration,
-            time_step,
             particles,
+            time_step,
         )
 
     def msd(
@@ -356,10 +646,40 @@ class FBm:
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
 
-        return _core.fbm_msd(
-            self.start_position,
-            self.hurst_exponent,
+        return fbm_msd(
+            *self._args,
             duration,
+            particles,
             time_step,
+        )
+
+    def mean_msd(
+        self,
+        duration: real,
+        time_step: float = 0.01,
+        particles: int = 10_000,
+    ) -> tuple[float, float]:
+        """
+        Calculate the mean and the mean squared displacement (MSD) of the FBM together.
+
+        Both statistics are estimated from the same ensemble, which halves the number
+        of simulated paths compared to calling `mean` and `msd` separately.
+
+        Args:
+            duration (real): The total duration of the simulation.
+            time_step (float, optional): Step size for the simulation. Defaults to 0.01.
+            particles (int, optional): Number of particles (positive integer) for ensemble averaging. Defaults to 10_000.
+
+        Returns:
+            tuple[float, float]: The mean and the mean squared displacement of the FBM.
+        """
+        duration = validate_positive_float(duration, "duration (motion duration)")
+        particles = validate_particles(particles)
+        time_step = validate_positive_float(time_step, "time_step")
+
+        return fbm_mean_msd(
+            *self._args,
+            duration,
             particles,
+            time_step,
         )
@@ -1,3 +1,6 @@
+import numpy as np
+import numpy.typing as npt
+
 from diffusionx import _core
 
 from .basic import Vector, real
@@ -10,8 +13,25 @@ from .utils import (
     validate_positive_integer,
 )
 
+_MOMENT_FNS = {
+    (True, False): _core.gamma_raw_moment,
+    (True, True): _core.gamma_central_moment,
+    (False, False): _core.gamma_frac_raw_moment,
+    (False, True): _core.gamma_frac_central_moment,
+}
+_OCCUPATION_TIME_MOMENT_FNS = (
+    _core.gamma_occupation_time_raw_moment,
+    _core.gamma_occupation_time_central_moment,
+)
+_FPT_FNS = {
+    "grid": _core.gamma_fpt,
+    "bridge": _core.gamma_fpt_bridge,
+}
+
 
 class Gamma:
+    __slots__ = ("_args",)
+
     def __init__(
         self,
         shape: real,  # Also known as alpha or k
@@ -27,18 +47,85 @@ class Gamma:
             rate (real): Rate parameter (beta > 0). The scale parameter is 1/rate.
             start_position (real, optional): Starting position. Defaults to 0.0.
         """
-        self.shape: float = validate_positive_float(shape, "shape")
-        self.rate: float = validate_positive_float(rate, "rate")
+        self._args: tuple[float, float] = (
+            validate_positive_float(shape, "shape"),
+            validate_positive_float(rate, "rate"),
+        )
+
+    @property
+    def shape(self) -> float:
+        """The shape parameter."""
+        return self._args[0]
+
+    @property
+    def rate(self) -> float:
+        """The rate parameter."""
+        return self._args[1]
 
     def simulate(
-        self, duration: real, time_step: float = 0.01
+        self,
+        duration: real,
+        time_step: float = 0.01,
+        dtype: npt.DTypeLike = np.float64,
     ) -> tuple[Vector, Vector]:
+        """
+        Simulate the Gamma process.
+
+        Args:
+            duration (real): Total duration of the simulation.
+            time_step (real, optional): Step size for the simulation. Defaults to 0.01.
+            dtype (DTypeLike, optional): Precision of the returned arrays, float64 or float32.
+                The path is always generated in float64. Defaults to np.float64.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Times and positions of the Gamma process.
+        """
         duration = validate_positive_float(duration, "duration")
         time_step = validate_positive_float(time_step, "time_step")
+        if dtype is not np.float64:
+            dtype = np.dtype(dtype)
+            if dtype == np.float32:
+                return _core.gamma_simulate_f32(
+                    *self._args,
+                    duration,
+                    time_step,
+                )
+            if dtype != np.float64:
+                raise ValueError(f"dtype must be float32 or float64, got {dtype}")
 
         return _core.gamma_simulate(
-            self.shape,
-            self.rate,
+            *self._args,
+            duration,
+            time_step,
+        )
+
+    def simulate_into(
+        self,
+        out_times: npt.NDArray[np.float64],
+        out_positions: npt.NDArray[np.float64],
+        duration: real,
+        time_step: float = 0.01,
+    ) -> int:
+        """
+        Simulate the Gamma process into preallocated arrays.
+
+        Args:
+            out_times (np.ndarray): Contiguous float64 array receiving the times.
+            out_positions (np.ndarray): Contiguous float64 array receiving the positions.
+            duration (real): Total duration of the simulation.
+            time_step (real, optional): Step size for the simulation. Defaults to 0.01.
+
+        Returns:
+            int: Number of samples written to the front of each array. Entries past it
+                are left unchanged.
+        """
+        duration = validate_positive_float(duration, "duration")
+        time_step = validate_positive_float(time_step, "time_step")
+
+        return _core.gamma_simulate_into(
+            *self._args,
+            out_times,
+            out_positions,
             duration,
             time_step,
         )
@@ -50,53 +137,128 @@ class Gamma:
         central: bool = False,
         particles: int = 10_000,
         time_step: float = 0.01,
+        n_threads: int | None = None,
     ) -> float:
+        order, central, particles, time_step, duration, _ = _core.validate_moment_args(
+            order, central, particles, time_step, duration
+        )
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
+        if order == 0:
+            return 1.0
+        if central and order == 1:
+            return 0.0
+
+        return _MOMENT_FNS[isinstance(order, int), central](
+            *self._args,
+            duration,
+            time_step,
+            order,
+            particles,
+            n_threads,
+        )
+
+    def moments(
+        self,
+        duration: real,
+        orders: npt.ArrayLike,
+        central: bool = False,
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        n_threads: int | None = None,
+    ) -> Vector:
+        """
+        Calculate several integer moments of the Gamma process from one ensemble.
+
+        Args:
+            duration (real): Simulation duration.
+            orders (ArrayLike): Moment orders (non-negative integers).
+            central (bool, optional): Whether to calculate central moments. Defaults to False.
+            particles (int, optional): Number of particles (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
+
+        Returns:
+            np.ndarray: The moment for each entry of `orders`, in the same order.
+        """
         validate_bool(central, "central")
-        validate_order(order)
+        orders = np.asarray(orders)
+        if orders.ndim != 1 or not np.issubdtype(orders.dtype, np.integer):
+            raise TypeError("orders must be a one-dimensional sequence of integers")
+        if np.any(orders < 0):
+            raise ValueError("orders must be non-negative")
         particles = validate_particles(particles)
         duration = validate_positive_float(duration, "duration")
         time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
-        return (
-            (
-                _core.gamma_raw_moment(
-                    self.shape,
-                    self.rate,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-                if not central
-                else _core.gamma_central_moment(
-                    self.shape,
-                    self.rate,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-            )
-            if isinstance(order, int)
-            else (
-                _core.gamma_frac_raw_moment(
-                    self.shape,
-                    self.rate,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-                if not central
-                else _core.gamma_frac_central_moment(
-                    self.shape,
-                    self.rate,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-            )
+        return _core.gamma_moments(
+            *self._args,
+            duration,
+            time_step,
+            orders.tolist(),
+            central,
+            particles,
+            n_threads,
+        )
+
+    def moments_over_durations(
+        self,
+        durations: npt.ArrayLike,
+        order: int,
+        central: bool = False,
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        n_threads: int | None = None,
+    ) -> Vector:
+        """
+        Calculate an integer moment of the Gamma process at several durations.
+
+        Every particle is simulated once up to the longest duration, and the
+        shorter durations are read off the same path at their grid samples.
+
+        Args:
+            durations (ArrayLike): Durations at which to evaluate the moment (positive).
+                Each must be a whole multiple of time_step.
+            order (int): Order of the moment (non-negative integer).
+            central (bool, optional): Whether to calculate central moments. Defaults to False.
+            particles (int, optional): Number of particles (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
+
+        Returns:
+            np.ndarray: The moment at each entry of `durations`, in the same order.
+        """
+        validate_bool(central, "central")
+        if type(order) is not int:
+            raise TypeError(f"order must be an integer, got {type(order).__name__}")
+        validate_order(order)
+        durations = np.asarray(durations, dtype=np.float64)
+        if durations.ndim != 1 or durations.size == 0:
+            raise ValueError("durations must be a non-empty one-dimensional sequence")
+        if not np.all((durations > 0) & np.isfinite(durations)):
+            raise ValueError("durations must be positive and finite")
+        particles = validate_particles(particles)
+        time_step = validate_positive_float(time_step, "time_step")
+        steps = durations / time_step
+        if not np.allclose(steps, np.round(steps), rtol=0.0, atol=1e-9):
+            raise ValueError("durations must be whole multiples of time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
+        if order == 0:
+            return np.ones(durations.shape)
+        if central and order == 1:
+            return np.zeros(durations.shape)
+
+        return _core.gamma_moments_over_durations(
+            *self._args,
+            durations.tolist(),
+            time_step,
+            order,
+            central,
+            particles,
+            n_threads,
         )
 
     def fpt(
@@ -104,16 +266,53 @@ class Gamma:
         domain: tuple[real, real],
         time_step: float = 0.01,
         max_duration: real = 1000,
+        method: str = "grid",
     ) -> float | None:
-        a, b = validate_domain(domain, process_name="Gamma FPT")
+        """
+        Calculate the first passage time of the Gamma process.
+
+        Args:
+            domain (tuple[real, real]): Domain (a, b) for FPT. a must be less than b.
+            time_step (real, optional): Step size, and the resolution of the result. Defaults to 0.01.
+            max_duration (real, optional): Maximum simulation duration for FPT. Defaults to 1000.
+            method (str, optional): "grid" samples every step of the path. "bridge" takes
+                coarse steps and refines the crossing by gamma-bridge bisection, which is
+                much cheaper when the passage takes many steps. Defaults to "grid".
+
+        Returns:
+            Optional[float]: The FPT, or None if max_duration is reached first.
+        """
+        fpt = _FPT_FNS.get(method)
+        if fpt is None:
+            raise ValueError(f"method must be 'grid' or 'bridge', got {method!r}")
+        domain = validate_domain(domain, process_name="Gamma FPT")
         time_step = validate_positive_float(time_step, "time_step")
         max_duration = validate_positive_float(max_duration, "max_duration")
 
-        return _core.gamma_fpt(
-            self.shape,
-            self.rate,
+        return fpt(
+            *self._args,
+            time_step,
+            domain,
+            max_duration,
+        )
+
+    def fpt_batch(
+        self,
+        domain: tuple[real, real],
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        max_duration: real = 1000,
+    ) -> Vector:
+        domain = validate_domain(domain, process_name="Gamma FPT batch")
+        particles = validate_particles(particles)
+        time_step = validate_positive_float(time_step, "time_step")
+        max_duration = validate_positive_float(max_duration, "max_duration")
+
+        return _core.gamma_fpt_batch(
+            *self._args,
+            domain,
+            particles,
             time_step,
-            (a, b),
             max_duration,
         )
 
@@ -125,33 +324,69 @@ class Gamma:
         particles: int = 10_000,
         time_step: float = 0.01,
         max_duration: real = 1000,
+        n_threads: int | None = None,
+        tol: float | None = None,
     ) -> float | None:
-        validate_bool(central, "central")
-        validate_order(order)
-        a, b = validate_domain(domain, process_name="Gamma FPT raw moment")
-        particles = validate_particles(particles)
-        time_step = validate_positive_float(time_step, "time_step")
-        max_duration = validate_positive_float(max_duration, "max_duration")
+        """
+        Calculate a moment of the first passage time of the Gamma process.
+
+        Args:
+            domain (tuple[real, real]): Domain (a, b) for FPT. a must be less than b.
+            order (int): Order of the moment (non-negative integer).
+            central (bool, optional): Whether to calculate the central moment. Defaults to False.
+            particles (int, optional): Number of particles (positive integer). With `tol`, the
+                maximum number of particles. Defaults to 10_000.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            max_duration (real, optional): Maximum simulation duration for FPT. Defaults to 1000.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
+            tol (float, optional): Relative standard error at which sampling stops early. Raw
+                moments only. The error is first checked after 1024 particles, so that an
+                unsampled heavy tail cannot stop sampling on a small early variance.
+                Defaults to None, which always simulates `particles` particles.
+
+        Returns:
+            Optional[float]: The moment, or None if some particle did not leave the domain
+                before max_duration.
+        """
+        order, central, particles, time_step, max_duration, domain = (
+            _core.validate_moment_args(
+                order,
+                central,
+                particles,
+                time_step,
+                max_duration,
+                domain,
+                "max_duration",
+                "Gamma FPT raw moment",
+            )
+        )
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
+        if tol is not None:
+            if central:
+                raise ValueError("tol is only supported for raw moments")
+            tol = validate_positive_float(tol, "tol")
 
         result = (
             _core.gamma_fpt_raw_moment(
-                self.shape,
-                self.rate,
-                (a, b),
+                *self._args,
+                domain,
                 order,
                 particles,
                 time_step,
                 max_duration,
+                n_threads,
+                tol,
             )
             if not central
             else _core.gamma_fpt_central_moment(
-                self.shape,
-                self.rate,
-                (a, b),
+                *self._args,
+                domain,
                 order,
                 particles,
                 time_step,
                 max_duration,
+                n_threads,
             )
         )
 
@@ -163,14 +398,13 @@ class Gamma:
         duration: real,
         time_step: float = 0.01,
     ) -> float:
-        a, b = validate_domain(domain, process_name="Gamma Occupation Time")
+        domain = validate_domain(domain, process_name="Gamma Occupation Time")
         duration = validate_positive_float(duration, "duration")
         time_step = validate_positive_float(time_step, "time_step")
 
         return _core.gamma_occupation_time(
-            self.shape,
-            self.rate,
-            (a, b),
+            *self._args,
+            domain,
             time_step,
             duration,
         )
@@ -183,37 +417,35 @@ class Gamma:
         central: bool = False,
         particles: int = 10_000,
         time_step: float = 0.01,
+        n_threads: int | None = None,
     ) -> float:
-        validate_bool(central, "central")
-        validate_order(order)
-        a, b = validate_domain(domain, process_name="Gamma Occupation raw moment")
-        particles = validate_particles(particles)
-        duration = validate_positive_float(duration, "duration")
-        time_step = validate_positive_float(time_step, "time_step")
-
-        result = (
-            _core.gamma_occupation_time_raw_moment(
-                self.shape,
-                self.rate,
-                (a, b),
-                order,
-                particles,
-                time_step,
-                duration,
-            )
-            if not central
-            else _core.gamma_occupation_time_central_moment(
-                self.shape,
-                self.rate,
-                (a, b),
+        order, central, particles, time_step, duration, domain = (
+            _core.validate_moment_args(
                 order,
+                central,
                 particles,
                 time_step,
                 duration,
+                domain,
+                process_name="Gamma Occupation raw moment",
             )
         )
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
+        if order == 0:
+            return 1.0
+        if central and order == 1:
+            return 0.0
 
-        return result
+        return _OCCUPATION_TIME_MOMENT_FNS[central](
+            *self._args,
+            domain,
+            order,
+            particles,
+            time_step,
+            duration,
+            n_threads,
+        )
 
     def tamsd(
         self,
@@ -228,14 +460,49 @@ class Gamma:
         quad_order = validate_positive_integer(quad_order, "quad_order")
 
         return _core.gamma_tamsd(
-            self.shape,
-            self.rate,
+            *self._args,
             duration,
             delta,
             time_step,
             quad_order,
         )
 
+    def tamsd_curve(
+        self,
+        duration: real,
+        deltas: npt.ArrayLike,
+        time_step: float = 0.01,
+    ) -> Vector:
+        """
+        Calculate the time-averaged MSD at several lags from one path of the Gamma process.
+
+        The path is simulated once, and each lag is rounded to the nearest multiple of
+        time_step and evaluated as a discrete average of squared increments over every
+        start sample. This is a grid estimator, so it can differ from `tamsd` at the
+        same lag, which integrates the path by quadrature.
+
+        Args:
+            duration (real): Simulation duration.
+            deltas (ArrayLike): Lags, each finite, at least time_step and less than
+                duration. Lags off the time_step grid are rounded to it.
+            time_step (real, optional): Step size. Defaults to 0.01.
+
+        Returns:
+            np.ndarray: The TAMSD at each entry of `deltas`, in the same order.
+        """
+        duration = validate_positive_float(duration, "duration")
+        time_step = validate_positive_float(time_step, "time_step")
+        deltas = np.asarray(deltas, dtype=np.float64)
+        if deltas.ndim != 1:
+            raise ValueError("deltas must be a one-dimensional sequence")
+
+        return _core.gamma_tamsd_curve(
+            *self._args,
+            duration,
+            deltas.tolist(),
+            time_step,
+        )
+
     def eatamsd(
         self,
         duration: real,
@@ -243,25 +510,32 @@ class Gamma:
         particles: int = 10_000,
         time_step: float = 0.01,
         quad_order: int = 10,
+        n_threads: int | None = None,
     ) -> float:
         duration = validate_positive_float(duration, "duration")
         delta = validate_positive_float(delta, "delta")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
         quad_order = validate_positive_integer(quad_order, "quad_order")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         return _core.gamma_eatamsd(
-            self.shape,
-            self.rate,
+            *self._args,
             duration,
             delta,
             particles,
             time_step,
             quad_order,
+            n_threads,
         )
 
     def mean(
-        self, duration: real, time_step: float = 0.01, particles: int = 10_000
+        self,
+        duration: real,
+        time_step: float = 0.01,
+        particles: int = 10_000,
+        n_threads: int | None = None,
     ) -> float:
         """
         Calculate the mean of the Gamma process.
@@ -270,6 +544,7 @@ class Gamma:
             duration (real): The total duration of the simulation.
             time_step (float, optional): Step size for the simulation. Defaults to 0.01.
             particles (int, optional): Number of particles (positive integer) for ensemble averaging. Defaults to 10_000.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
 
         Returns:
             float: The mean of the Gamma process.
@@ -277,13 +552,15 @@ class Gamma:
         duration = validate_positive_float(duration, "duration (motion duration)")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         return _core.gamma_mean(
-            self.shape,
-            self.rate,
+            *self._args,
             duration,
-            time_step,
             particles,
+            time_step,
+            n_threads,
         )
 
     def msd(
@@ -291,6 +568,7 @@ class Gamma:
         duration: real,
         time_step: float = 0.01,
         particles: int = 10_000,
+        n_threads: int | None = None,
     ) -> float:
         """
         Calculate the mean squared displacement (MSD) of the Gamma process.
@@ -299,6 +577,7 @@ class Gamma:
             duration (real): The total duration of the simulation.
             time_step (float, optional): Step size for the simulation. Defaults to 0.01.
             particles (int, optional): Number of particles (positive integer) for ensemble averaging. Defaults to 10_000.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
 
         Returns:
             float: The mean squared displacement of the Gamma process.
@@ -306,11 +585,13 @@ class Gamma:
         duration = validate_positive_float(duration, "duration (motion duration)")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         return _core.gamma_msd(
-            self.shape,
-            self.rate,
+            *self._args,
             duration,
-            time_step,
             particles,
+            time_step,
+            n_threads,
         )
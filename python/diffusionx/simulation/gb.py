@@ -1,8 +1,10 @@
+import numpy as np
+import numpy.typing as npt
+
 from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -11,6 +13,13 @@ from .utils import (
     validate_positive_integer,
 )
 
+_MOMENT_FNS = {
+    (True, False): _core.gb_raw_moment,
+    (True, True): _core.gb_central_moment,
+    (False, False): _core.gb_frac_raw_moment,
+    (False, True): _core.gb_frac_central_moment,
+}
+
 
 class GeometricBm:
     def __init__(
@@ -29,7 +38,7 @@ class GeometricBm:
             sigma (real, optional): Volatility coefficient (sigma > 0). Defaults to 0.1.
         """
         self.start_value = validate_positive_float(start_value, "start_value")
-        self.mu = ensure_float(mu)
+        self.mu = _core.ensure_float(mu)
         self.sigma = validate_positive_float(sigma, "sigma")
 
     def simulate(
@@ -53,57 +62,72 @@ class GeometricBm:
         central: bool = False,
         particles: int = 10_000,
         time_step: float = 0.01,
+        n_threads: int | None = None,
     ) -> float:
         validate_bool(central, "central")
         validate_order(order)
         particles = validate_particles(particles)
         duration = validate_positive_float(duration, "duration")
         time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
-        return (
-            (
-                _core.gb_raw_moment(
-                    self.start_value,
-                    self.mu,
-                    self.sigma,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-                if not central
-                else _core.gb_central_moment(
-                    self.start_value,
-                    self.mu,
-                    self.sigma,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-            )
-            if isinstance(order, int)
-            else (
-                _core.gb_frac_raw_moment(
-                    self.start_value,
-                    self.mu,
-                    self.sigma,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-                if not central
-                else _core.gb_frac_central_moment(
-                    self.start_value,
-                    self.mu,
-                    self.sigma,
-                    duration,
-                    time_step,
-                    order,
-                    particles,
-                )
-            )
+        return _MOMENT_FNS[isinstance(order, int), central](
+            self.start_value,
+            self.mu,
+            self.sigma,
+            duration,
+            time_step,
+            order,
+            particles,
+            n_threads,
+        )
+
+    def moments(
+        self,
+        duration: real,
+        orders: npt.ArrayLike,
+        central: bool = False,
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        n_threads: int | None = None,
+    ) -> Vector:
+        """
+        Calculate several integer moments of the Geometric Brownian Motion from one ensemble.
+
+        Args:
+            duration (real): Simulation duration.
+            orders (ArrayLike): Moment orders (non-negative integers).
+            central (bool, optional): Whether to calculate central moments. Defaults to False.
+            particles (int, optional): Number of particles (positive integer). Defaults to 10_000.
+            time_step (real, optional): Step size. Defaults to 0.01.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
+
+        Returns:
+            np.ndarray: The moment for each entry of `orders`, in the same order.
+        """
+        validate_bool(central, "central")
+        orders = np.asarray(orders)
+        if orders.ndim != 1 or not np.issubdtype(orders.dtype, np.integer):
+            raise TypeError("orders must be a one-dimensional sequence of integers")
+        if np.any(orders < 0):
+            raise ValueError("orders must be non-negative")
+        particles = validate_particles(particles)
+        duration = validate_positive_float(duration, "duration")
+        time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
+
+        return _core.gb_moments(
+            self.start_value,
+            self.mu,
+            self.sigma,
+            duration,
+            time_step,
+            orders.tolist(),
+            central,
+            particles,
+            n_threads,
         )
 
     def fpt(
@@ -112,7 +136,7 @@ class GeometricBm:
         time_step: float = 0.01,
         max_duration: real = 1000,
     ) -> float | None:
-        a, b = validate_domain(domain, process_name="Gb FPT")
+        domain = validate_domain(domain, process_name="Gb FPT")
         time_step = validate_positive_float(time_step, "time_step")
         max_duration = validate_positive_float(max_duration, "max_duration")
 
@@ -121,7 +145,29 @@ class GeometricBm:
             self.mu,
             self.sigma,
             time_step,
-            (a, b),
+            domain,
+            max_duration,
+        )
+
+    def fpt_batch(
+        self,
+        domain: tuple[real, real],
+        particles: int = 10_000,
+        time_step: float = 0.01,
+        max_duration: real = 1000,
+    ) -> Vector:
+        domain = validate_domain(domain, process_name="Gb FPT batch")
+        particles = validate_particles(particles)
+        time_step = validate_positive_float(time_step, "time_step")
+        max_duration = validate_positive_float(max_duration, "max_duration")
+
+        return _core.gb_fpt_batch(
+            self.start_value,
+            self.mu,
+            self.sigma,
+            domain,
+            particles,
+            time_step,
             max_duration,
         )
 
@@ -133,35 +179,40 @@ class GeometricBm:
         particles: int = 10_000,
         time_step: float = 0.01,
         max_duration: real = 1000,
+        n_threads: int | None = None,
     ) -> float | None:
         validate_bool(central, "central")
         validate_order(order)
-        a, b = validate_domain(domain, process_name="Gb FPT raw moment")
+        domain = validate_domain(domain, process_name="Gb FPT raw moment")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
         max_duration = validate_positive_float(max_duration, "max_duration")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         result = (
             _core.gb_fpt_raw_moment(
                 self.start_value,
                 self.mu,
                 self.sigma,
-                (a, b),
+                domain,
                 order,
                 particles,
                 time_step,
                 max_duration,
+                n_threads,
             )
             if not central
             else _core.gb_fpt_central_moment(
                 self.start_value,
                 self.mu,
                 self.sigma,
-                (a, b),
+                domain,
                 order,
                 particles,
                 time_step,
                 max_duration,
+                n_threads,
             )
         )
 
@@ -173,14 +224,14 @@ class GeometricBm:
         duration: real,
         time_step: float = 0.01,
     ) -> float:
-        a, b = validate_domain(domain, process_name="Gb Occupation Time")
+        domain = validate_domain(domain, process_name="Gb Occupation Time")
         duration = validate_positive_float(duration, "duration")
         time_step = validate_positive_float(time_step, "time_step")
         return _core.gb_occupation_time(
             self.start_value,
             self.mu,
             self.sigma,
-            (a, b),
+            domain,
             time_step,
             duration,
         )
@@ -193,35 +244,40 @@ class GeometricBm:
         central: bool = False,
         particles: int = 10_000,
         time_step: float = 0.01,
+        n_threads: int | None = None,
     ) -> float:
         validate_bool(central, "central")
         validate_order(order)
-        a, b = validate_domain(domain, process_name="Gb Occupation raw moment")
+        domain = validate_domain(domain, process_name="Gb Occupation raw moment")
         particles = validate_particles(particles)
         duration = validate_positive_float(duration, "duration")
         time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         result = (
             _core.gb_occupation_time_raw_moment(
                 self.start_value,
                 self.mu,
                 self.sigma,
-                (a, b),
+                domain,
                 order,
                 particles,
                 time_step,
                 duration,
+                n_threads,
             )
             if not central
             else _core.gb_occupation_time_central_moment(
                 self.start_value,
                 self.mu,
                 self.sigma,
-                (a, b),
+                domain,
                 order,
                 particles,
                 time_step,
                 duration,
+                n_threads,
             )
         )
 
@@ -249,6 +305,44 @@ class GeometricBm:
             quad_order,
         )
 
+    def tamsd_curve(
+        self,
+        duration: real,
+        deltas: npt.ArrayLike,
+        time_step: float = 0.01,
+    ) -> Vector:
+        """
+        Calculate the time-averaged MSD at several lags from one path of the Geometric Brownian Motion.
+
+        The path is simulated once, and each lag is rounded to the nearest multiple of
+        time_step and evaluated as a discrete average of squared increments over every
+        start sample. This is a grid estimator, so it can differ from `tamsd` at the
+        same lag, which integrates the path by quadrature.
+
+        Args:
+            duration (real): Simulation duration.
+            deltas (ArrayLike): Lags, each finite, at least time_step and less than
+                duration. Lags off the time_step grid are rounded to it.
+            time_step (real, optional): Step size. Defaults to 0.01.
+
+        Returns:
+            np.ndarray: The TAMSD at each entry of `deltas`, in the same order.
+        """
+        duration = validate_positive_float(duration, "duration")
+        time_step = validate_positive_float(time_step, "time_step")
+        deltas = np.asarray(deltas, dtype=np.float64)
+        if deltas.ndim != 1:
+            raise ValueError("deltas must be a one-dimensional sequence")
+
+        return _core.gb_tamsd_curve(
+            self.start_value,
+            self.mu,
+            self.sigma,
+            duration,
+            deltas.tolist(),
+            time_step,
+        )
+
     def eatamsd(
         self,
         duration: real,
@@ -256,12 +350,15 @@ class GeometricBm:
         particles: int = 10_000,
         time_step: float = 0.01,
         quad_order: int = 32,
+        n_threads: int | None = None,
     ) -> float:
         duration = validate_positive_float(duration, "duration")
         delta = validate_positive_float(delta, "delta")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
         quad_order = validate_positive_integer(quad_order, "quad_order")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         return _core.gb_eatamsd(
             self.start_value,
@@ -272,10 +369,15 @@ class GeometricBm:
             particles,
             time_step,
             quad_order,
+            n_threads,
         )
 
     def mean(
-        self, duration: real, time_step: float = 0.01, particles: int = 10_000
+        self,
+        duration: real,
+        time_step: float = 0.01,
+        particles: int = 10_000,
+        n_threads: int | None = None,
     ) -> float:
         """
         Calculate the mean of the Geometric Brownian Motion.
@@ -284,6 +386,7 @@ class GeometricBm:
             duration (real): The total duration of the simulation.
             time_step (float, optional): Step size for the simulation. Defaults to 0.01.
             particles (int, optional): Number of particles (positive integer) for ensemble averaging. Defaults to 10_000.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
 
         Returns:
             float: The mean of the Geometric Brownian Motion.
@@ -291,14 +394,17 @@ class GeometricBm:
         duration = validate_positive_float(duration, "duration (motion duration)")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         return _core.gb_mean(
             self.start_value,
             self.mu,
             self.sigma,
             duration,
-            time_step,
             particles,
+            time_step,
+            n_threads,
         )
 
     def msd(
@@ -306,6 +412,7 @@ class GeometricBm:
         duration: real,
         time_step: float = 0.01,
         particles: int = 10_000,
+        n_threads: int | None = None,
     ) -> float:
         """
         Calculate the mean squared displacement (MSD) of the Geometric Brownian Motion.
@@ -314,6 +421,7 @@ class GeometricBm:
             duration (real): The total duration of the simulation.
             time_step (float, optional): Step size for the simulation. Defaults to 0.01.
             particles (int, optional): Number of particles (positive integer) for ensemble averaging. Defaults to 10_000.
+            n_threads (int, optional): Number of worker threads. Defaults to None, which uses all cores.
 
         Returns:
             float: The mean squared displacement of the Geometric Brownian Motion.
@@ -321,12 +429,15 @@ class GeometricBm:
         duration = validate_positive_float(duration, "duration (motion duration)")
         particles = validate_particles(particles)
         time_step = validate_positive_float(time_step, "time_step")
+        if n_threads is not None:
+            n_threads = validate_positive_integer(n_threads, "n_threads")
 
         return _core.gb_msd(
             self.start_value,
             self.mu,
             self.sigma,
             duration,
-            time_step,
             particles,
+            time_step,
+            n_threads,
         )
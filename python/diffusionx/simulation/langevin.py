@@ -4,7 +4,6 @@ from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -49,7 +48,7 @@ class Langevin:
             )
         self.drift_func = drift_func
         self.diffusion_func = diffusion_func
-        self.start_position = ensure_float(start_position)
+        self.start_position = _core.ensure_float(start_position)
 
     def simulate(self, duration: real, time_step: real) -> tuple[Vector, Vector]:
         """
@@ -361,7 +360,7 @@ class GeneralizedLangevin:
                 f"diffusion_func must be a callable function, got {type(diffusion_func).__name__}"
             )
 
-        start_position = ensure_float(start_position)
+        start_position = _core.ensure_float(start_position)
         alpha = validate_positive_float(alpha, "alpha")
 
         if not (alpha <= 2):
@@ -700,7 +699,7 @@ class SubordinatedLangevin:
             raise TypeError(
                 f"diffusion_func must be a callable function, got {type(diffusion_func).__name__}"
             )
-        start_position = ensure_float(start_position)
+        start_position = _core.ensure_float(start_position)
         alpha = validate_positive_float(alpha, "alpha")
         if not (alpha < 1):
             raise ValueError(
@@ -2,7 +2,6 @@ from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -29,7 +28,7 @@ class Levy:
         if not (alpha <= 2):
             raise ValueError(f"alpha must be in the range (0, 2], got {alpha}")
 
-        self.start_position = ensure_float(start_position)
+        self.start_position = _core.ensure_float(start_position)
         self.alpha = alpha
 
     def simulate(
@@ -494,8 +493,8 @@ class AsymmetricLevy:
             start_position (real, optional): Starting position. Defaults to 0.0.
         """
         alpha = validate_positive_float(alpha, "alpha")
-        beta = ensure_float(beta)
-        start_position = ensure_float(start_position)
+        beta = _core.ensure_float(beta)
+        start_position = _core.ensure_float(start_position)
 
         if not (alpha <= 2):
             raise ValueError(f"alpha must be in the range (0, 2], got {alpha}")
@@ -2,7 +2,6 @@ from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -28,7 +27,7 @@ class LevyWalk:
         """
         alpha = validate_positive_float(alpha, "alpha")
         velocity = validate_positive_float(velocity, "velocity")
-        start_position = ensure_float(start_position)
+        start_position = _core.ensure_float(start_position)
 
         if not (alpha <= 2):
             raise ValueError(f"alpha must be in (0, 2], got {alpha}")
@@ -2,7 +2,6 @@ from diffusionx import _core
 
 from .basic import Vector, real
 from .utils import (
-    ensure_float,
     validate_bool,
     validate_domain,
     validate_order,
@@ -31,7 +30,7 @@ class OU:
         """
         self.theta = validate_positive_float(theta, "theta")
         self.sigma = validate_positive_float(sigma, "sigma")
-        self.start_position = ensure_float(start_position)
+        self.start_position = _core.ensure_float(start_position)
 
     def simulate(
         self, duration: real, time_step: float = 0.01
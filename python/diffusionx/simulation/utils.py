@@ -1,25 +1,17 @@
-from math import isfinite
-from typing import Union
+from math import inf, isfinite
 
-real = Union[float, int]
+real = float | int
 
 
-def ensure_float(value: real) -> float:
-    """Ensure the input value is a float, converting from int if necessary."""
-    if isinstance(value, bool):
-        raise TypeError("Expected float or int, got bool")
-    if isinstance(value, float):
-        return value
-    elif isinstance(value, int):
-        return float(value)
-    else:
-        # This case should ideally not be reached if type hints are respected,
-        # but as a runtime check for robustness:
-        raise TypeError(f"Expected float or int, got {type(value).__name__}")
+def _is_real(value: object) -> bool:
+    """Whether value is an int or float, excluding bool."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
 
 
 def validate_order(order: int | float) -> None:
     """Validate that order is a non-negative integer or float."""
+    if type(order) is int and order >= 0:
+        return
     if isinstance(order, bool) or not (
         isinstance(order, int) or isinstance(order, float)
     ):
@@ -34,6 +26,8 @@ def validate_order(order: int | float) -> None:
 
 def validate_positive_integer(val: int, name: str) -> int:
     """Validate that val is a positive integer."""
+    if type(val) is int and val > 0:
+        return val
     if isinstance(val, bool) or not isinstance(val, int):
         raise TypeError(f"{name} must be an integer, got {type(val).__name__}")
     if val <= 0:
@@ -41,10 +35,11 @@ def validate_positive_integer(val: int, name: str) -> int:
     return val
 
 
-def validate_bool(val: bool, name: str):
+def validate_bool(val: bool, name: str) -> bool:
     """Validate that val is a boolean."""
-    if not isinstance(val, bool):
-        raise TypeError(f"{name} must be a boolean, got {type(val).__name__}")
+    if val is True or val is False:
+        return val
+    raise TypeError(f"{name} must be a boolean, got {type(val).__name__}")
 
 
 def validate_particles(particles: int) -> int:
@@ -54,10 +49,13 @@ def validate_particles(particles: int) -> int:
 
 def validate_positive_float(value: real, param_name: str) -> float:
     """Validate that a parameter is a positive float after conversion."""
-    try:
-        float_value = ensure_float(value)
-    except TypeError as e:
-        raise TypeError(f"{param_name} must be a number. Error: {e}") from e
+    if type(value) is float and 0.0 < value < inf:
+        return value
+    if not _is_real(value):
+        raise TypeError(
+            f"{param_name} must be a number. Error: Expected float or int, got {type(value).__name__}"
+        )
+    float_value = float(value)
     if not isfinite(float_value):
         raise ValueError(f"{param_name} must be finite, got {float_value}")
     if float_value <= 0:
@@ -71,20 +69,32 @@ def validate_domain(
     process_name: str = "",
 ) -> tuple[float, float]:
     """Validate domain based on type and convert its elements to float."""
+    if (
+        domain_type == "interval"
+        and type(domain) is tuple
+        and len(domain) == 2
+        and type(domain[0]) is float
+        and type(domain[1]) is float
+        and domain[0] < domain[1]
+    ):
+        return domain
+
     if not (isinstance(domain, tuple) and len(domain) == 2):
         base_msg = "domain must be a tuple of two real numbers"
         if process_name:
             base_msg += f" for {process_name}"
         raise TypeError(f"{base_msg}, got {type(domain).__name__}")
 
-    try:
-        a = ensure_float(domain[0])
-        b = ensure_float(domain[1])
-    except TypeError as e:
-        base_msg = "Domain elements must be numbers convertible to float"
-        if process_name:
-            base_msg += f" for {process_name}"
-        raise TypeError(f"{base_msg}. Error: {e}") from e
+    for element in domain:
+        if not _is_real(element):
+            base_msg = "Domain elements must be numbers convertible to float"
+            if process_name:
+                base_msg += f" for {process_name}"
+            raise TypeError(
+                f"{base_msg}. Error: Expected float or int, got {type(element).__name__}"
+            )
+    a = float(domain[0])
+    b = float(domain[1])
 
     if domain_type == "interval":
         if a >= b:
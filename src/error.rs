@@ -1,5 +1,8 @@
 use diffusionx::XError;
-use pyo3::{PyErr, exceptions::PyValueError};
+use pyo3::{
+    PyErr,
+    exceptions::{PyRuntimeError, PyTypeError, PyValueError},
+};
 use thiserror::Error;
 
 pub type XPyResult<T> = Result<T, XPyError>;
@@ -8,6 +11,14 @@ pub type XPyResult<T> = Result<T, XPyError>;
 pub enum XPyError {
     #[error("Invalid value: {0}")]
     ValueError(String),
+    /// An argument rejected by the validators, raised as `ValueError` with the
+    /// same message as the Python validators in `simulation/utils.py`.
+    #[error("{0}")]
+    InvalidArgument(String),
+    #[error("{0}")]
+    TypeError(String),
+    #[error("{0}")]
+    RuntimeError(String),
 }
 
 impl From<XError> for XPyError {
@@ -18,6 +29,11 @@ impl From<XError> for XPyError {
 
 impl From<XPyError> for PyErr {
     fn from(error: XPyError) -> Self {
-        PyValueError::new_err(error.to_string())
+        match error {
+            XPyError::ValueError(_) => PyValueError::new_err(error.to_string()),
+            XPyError::InvalidArgument(message) => PyValueError::new_err(message),
+            XPyError::TypeError(message) => PyTypeError::new_err(message),
+            XPyError::RuntimeError(message) => PyRuntimeError::new_err(message),
+        }
     }
 }
@@ -7,6 +7,8 @@ pub mod random;
 
 pub mod simulation;
 
+mod validation;
+
 macro_rules! register_functions {
     // 匹配 a::b::c 形式
     ($m:ident, $($p1:ident::$p2:ident::$func:ident),* $(,)?) => {
@@ -57,6 +59,9 @@ fn _core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         random::skew_stable_rands,
         random::bool_rand,
         random::bool_rands,
+        // Validation
+        validation::ensure_float,
+        validation::validate_moment_args,
         // Trait methods wrapper
         simulation::moment,
         simulation::mean,
@@ -72,6 +77,7 @@ fn _core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         simulation::bm_frac_raw_moment,
         simulation::bm_frac_central_moment,
         simulation::bm_fpt,
+        simulation::bm_fpt_batch,
         simulation::bm_fpt_raw_moment,
         simulation::bm_fpt_central_moment,
         simulation::bm_occupation_time,
@@ -82,20 +88,30 @@ fn _core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         simulation::bm_mean,
         simulation::bm_msd,
         // Fractional Brownian Motion
+        simulation::fbm_validate_params,
         simulation::fbm_simulate,
+        simulation::fbm_simulate_f32,
+        simulation::fbm_simulate_batch,
+        simulation::fbm_simulate_batch_f32,
+        simulation::fbm_endpoints,
         simulation::fbm_raw_moment,
         simulation::fbm_central_moment,
         simulation::fbm_frac_raw_moment,
         simulation::fbm_frac_central_moment,
+        simulation::fbm_antithetic_moment,
         simulation::fbm_fpt,
+        simulation::fbm_fpt_batch,
         simulation::fbm_fpt_raw_moment,
         simulation::fbm_fpt_central_moment,
+        simulation::fbm_fpt_moment_grid,
+        simulation::fbm_fpt_moments,
         simulation::fbm_occupation_time,
         simulation::fbm_occupation_time_raw_moment,
         simulation::fbm_occupation_time_central_moment,
         simulation::fbm_tamsd,
         simulation::fbm_eatamsd,
         simulation::fbm_mean,
+        simulation::fbm_mean_msd,
         simulation::fbm_msd,
         // Continuous Time Random Walk
         simulation::ctrw_simulate_duration,
@@ -293,11 +309,17 @@ fn _core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         simulation::asymmetric_cauchy_eatamsd,
         // Gamma Process
         simulation::gamma_simulate,
+        simulation::gamma_simulate_f32,
+        simulation::gamma_simulate_into,
         simulation::gamma_raw_moment,
         simulation::gamma_central_moment,
+        simulation::gamma_moments,
+        simulation::gamma_moments_over_durations,
         simulation::gamma_frac_raw_moment,
         simulation::gamma_frac_central_moment,
         simulation::gamma_fpt,
+        simulation::gamma_fpt_bridge,
+        simulation::gamma_fpt_batch,
         simulation::gamma_fpt_raw_moment,
         simulation::gamma_fpt_central_moment,
         simulation::gamma_occupation_time,
@@ -306,6 +328,7 @@ fn _core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         simulation::gamma_mean,
         simulation::gamma_msd,
         simulation::gamma_tamsd,
+        simulation::gamma_tamsd_curve,
         simulation::gamma_eatamsd,
         // Geometric Brownian Motion
         simulation::gb_simulate,
@@ -314,14 +337,17 @@ fn _core(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         simulation::gb_frac_raw_moment,
         simulation::gb_frac_central_moment,
         simulation::gb_fpt,
+        simulation::gb_fpt_batch,
         simulation::gb_fpt_raw_moment,
         simulation::gb_fpt_central_moment,
         simulation::gb_occupation_time,
         simulation::gb_occupation_time_raw_moment,
         simulation::gb_occupation_time_central_moment,
         simulation::gb_mean,
+        simulation::gb_moments,
         simulation::gb_msd,
         simulation::gb_tamsd,
+        simulation::gb_tamsd_curve,
         simulation::gb_eatamsd,
         // Levy Walk
         simulation::levy_walk_simulate,
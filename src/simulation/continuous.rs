@@ -1,4 +1,7 @@
-use crate::{XPyError, XPyResult, simulation::PyArrayPair};
+use crate::{
+    XPyError, XPyResult,
+    simulation::{PyArrayPair, kernels::mean_power},
+};
 use gauss_quad::GaussLegendre;
 use numpy::PyArrayMethods;
 use pyo3::prelude::*;
@@ -83,22 +86,11 @@ pub fn tamsd(
     quad_order: usize,
 ) -> XPyResult<f64> {
     validate_tamsd_args(duration, delta, time_step, quad_order)?;
+    let nodes_weights = tamsd_nodes_weights(duration, delta, quad_order)?;
     let simulate = Arc::new(simulate_fn.clone_ref(py));
 
-    let legendre_quad = GaussLegendre::new(
-        NonZero::new(quad_order).ok_or_else(|| value_error("quad_order must be positive"))?,
-    );
-    let nodes_weights_pairs = legendre_quad.into_node_weight_pairs();
-    let nodes_weights = nodes_weights_transform(0.0, duration - delta, &nodes_weights_pairs);
-    let values: XPyResult<Vec<f64>> = nodes_weights
-        .into_par_iter()
-        .map(|(node, weight)| {
-            lagged_square_displacement(&simulate, node + delta, delta, time_step)
-                .map(|value| value * weight)
-        })
-        .collect();
-
-    Ok(values?.into_iter().sum::<f64>() / (duration - delta))
+    let x_vec = simulate_positions(&simulate, duration, time_step)?;
+    path_tamsd(&x_vec, duration, delta, time_step, &nodes_weights)
 }
 
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
@@ -113,26 +105,14 @@ pub fn eatamsd(
     quad_order: usize,
 ) -> XPyResult<f64> {
     validate_tamsd_args(duration, delta, time_step, quad_order)?;
+    let nodes_weights = tamsd_nodes_weights(duration, delta, quad_order)?;
     let simulate = Arc::new(simulate_fn.clone_ref(py));
 
     let values: XPyResult<Vec<f64>> = (0..particles)
         .into_par_iter()
         .map(|_| {
-            let legendre_quad = GaussLegendre::new(
-                NonZero::new(quad_order)
-                    .ok_or_else(|| value_error("quad_order must be positive"))?,
-            );
-            let nodes_weights_pairs = legendre_quad.into_node_weight_pairs();
-            let nodes_weights =
-                nodes_weights_transform(0.0, duration - delta, &nodes_weights_pairs);
-            let values: XPyResult<Vec<f64>> = nodes_weights
-                .into_par_iter()
-                .map(|(node, weight)| {
-                    lagged_square_displacement(&simulate, node + delta, delta, time_step)
-                        .map(|value| value * weight)
-                })
-                .collect();
-            Ok(values?.into_iter().sum::<f64>() / (duration - delta))
+            let x_vec = simulate_positions(&simulate, duration, time_step)?;
+            path_tamsd(&x_vec, duration, delta, time_step, &nodes_weights)
         })
         .collect();
 
@@ -151,13 +131,10 @@ fn raw_moment(
 
     let values: XPyResult<Vec<f64>> = (0..particles)
         .into_par_iter()
-        .map(|_| {
-            let end = endpoint(&simulate, duration, time_step)?;
-            Ok(if order == 1 { end } else { end.powi(order) })
-        })
+        .map(|_| endpoint(&simulate, duration, time_step))
         .collect();
 
-    Ok(values?.into_iter().sum::<f64>() / particles as f64)
+    Ok(mean_power(&values?, 0.0, order))
 }
 
 fn central_moment(
@@ -168,30 +145,16 @@ fn central_moment(
     time_step: f64,
     particles: usize,
 ) -> XPyResult<f64> {
-    let mean = raw_moment(
-        py,
-        simulate_fn.clone_ref(py),
-        1,
-        duration,
-        time_step,
-        particles,
-    )?;
-
     let simulate = Arc::new(simulate_fn.clone_ref(py));
 
     let values: XPyResult<Vec<f64>> = (0..particles)
         .into_par_iter()
-        .map(|_| {
-            let end = endpoint(&simulate, duration, time_step)?;
-            Ok(if order == 1 {
-                end - mean
-            } else {
-                (end - mean).powi(order)
-            })
-        })
+        .map(|_| endpoint(&simulate, duration, time_step))
         .collect();
+    let values = values?;
+    let mean = mean_power(&values, 0.0, 1);
 
-    Ok(values?.into_iter().sum::<f64>() / particles as f64)
+    Ok(mean_power(&values, mean, order))
 }
 
 fn simulate_positions(simulate: &Py<PyAny>, duration: f64, time_step: f64) -> XPyResult<Vec<f64>> {
@@ -215,23 +178,44 @@ fn endpoint(simulate: &Py<PyAny>, duration: f64, time_step: f64) -> XPyResult<f6
         .ok_or_else(|| value_error("simulate returned no positions"))
 }
 
-fn lagged_square_displacement(
-    simulate: &Py<PyAny>,
+fn tamsd_nodes_weights(duration: f64, delta: f64, quad_order: usize) -> XPyResult<Vec<(f64, f64)>> {
+    let legendre_quad = GaussLegendre::new(
+        NonZero::new(quad_order).ok_or_else(|| value_error("quad_order must be positive"))?,
+    );
+    let nodes_weights_pairs = legendre_quad.into_node_weight_pairs();
+    Ok(nodes_weights_transform(0.0, duration - delta, &nodes_weights_pairs))
+}
+
+/// Time-averaged MSD of one sampled path, integrating the lagged square
+/// displacement over `[0, duration - delta]` with the given quadrature rule.
+fn path_tamsd(
+    x_vec: &[f64],
     duration: f64,
     delta: f64,
     time_step: f64,
+    nodes_weights: &[(f64, f64)],
 ) -> XPyResult<f64> {
-    let x_vec = simulate_positions(simulate, duration, time_step)?;
-    let lag_length = (delta / time_step).ceil() as usize;
-    let lag_index = x_vec.len().checked_sub(lag_length + 1).ok_or_else(|| {
-        value_error("simulate returned too few positions for the requested delta")
-    })?;
-    let end_position = *x_vec
-        .last()
-        .ok_or_else(|| value_error("simulate returned no positions"))?;
-    let lag_position = x_vec[lag_index];
+    if x_vec.len() < 2 {
+        return Err(value_error("simulate returned too few positions"));
+    }
+    let integral: f64 = nodes_weights
+        .iter()
+        .map(|&(node, weight)| {
+            let displacement = interpolate(x_vec, time_step, node + delta)
+                - interpolate(x_vec, time_step, node);
+            displacement * displacement * weight
+        })
+        .sum();
+
+    Ok(integral / (duration - delta))
+}
 
-    Ok((end_position - lag_position) * (end_position - lag_position))
+/// Linearly interpolated position at time `t` on a path sampled every `time_step`.
+fn interpolate(x_vec: &[f64], time_step: f64, t: f64) -> f64 {
+    let scaled = t / time_step;
+    let index = (scaled.floor() as usize).min(x_vec.len() - 2);
+    let fraction = scaled - index as f64;
+    x_vec[index] + (x_vec[index + 1] - x_vec[index]) * fraction
 }
 
 fn validate_tamsd_args(
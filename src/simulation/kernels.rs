@@ -0,0 +1,253 @@
+use crate::{XPyError, XPyResult, validation::float_str};
+use pyo3::prelude::*;
+use rayon::prelude::*;
+
+/// Number of steps simulated in the first chunk of a chunked first-passage search.
+const INITIAL_CHUNK_STEPS: usize = 4096;
+
+/// Upper bound on the number of steps simulated in one chunk, which caps the
+/// memory held by a long first-passage search.
+const MAX_CHUNK_STEPS: usize = 1 << 18;
+
+/// Number of steps simulated per chunk by the streamed occupation time, small
+/// enough for a chunk to stay resident in L2 cache.
+const OCCUPATION_CHUNK_STEPS: usize = 1 << 14;
+
+/// Number of lanes compared per block by the branchless interval kernels.
+const LANES: usize = 4;
+
+/// Number of independent accumulators used by the counting kernels.
+const WIDE_LANES: usize = 8;
+
+/// Bitmask of the lanes in `block` that lie outside the open interval `(a, b)`.
+#[inline(always)]
+fn exit_mask(block: &[f64], a: f64, b: f64) -> u32 {
+    block
+        .iter()
+        .enumerate()
+        .fold(0, |mask, (lane, &x)| mask | (((x <= a) | (x >= b)) as u32) << lane)
+}
+
+/// Index of the first position outside the open interval `(a, b)`.
+pub(crate) fn first_exit_index(positions: &[f64], a: f64, b: f64) -> Option<usize> {
+    let blocks = positions.chunks_exact(LANES);
+    let tail = blocks.remainder();
+    for (index, block) in blocks.enumerate() {
+        let mask = exit_mask(block, a, b);
+        if mask != 0 {
+            return Some(index * LANES + mask.trailing_zeros() as usize);
+        }
+    }
+    let mask = exit_mask(tail, a, b);
+    (mask != 0).then(|| positions.len() - tail.len() + mask.trailing_zeros() as usize)
+}
+
+/// Number of positions inside the open interval `(a, b)`.
+///
+/// Each of the `WIDE_LANES` lanes keeps its own counter, so the loop body has no
+/// branches and no cross-lane dependency and vectorises to masked compares.
+pub(crate) fn count_inside(positions: &[f64], a: f64, b: f64) -> usize {
+    let blocks = positions.chunks_exact(WIDE_LANES);
+    let tail = blocks.remainder();
+    let mut counts = [0usize; WIDE_LANES];
+    for block in blocks {
+        for (count, &x) in counts.iter_mut().zip(block) {
+            *count += ((a < x) & (x < b)) as usize;
+        }
+    }
+    let tail_count = tail.iter().filter(|&&x| (a < x) & (x < b)).count();
+    counts.iter().sum::<usize>() + tail_count
+}
+
+/// Time a sampled path spends inside `domain`, as a left Riemann sum over the
+/// steps. Every step has length `time_step` except the last, which has length
+/// `last_step`.
+pub(crate) fn occupation_time(
+    positions: &[f64],
+    domain: (f64, f64),
+    time_step: f64,
+    last_step: f64,
+) -> f64 {
+    let (a, b) = domain;
+    match positions.len() {
+        0 | 1 => 0.0,
+        n => {
+            let last = positions[n - 2];
+            let last_inside = (a < last && last < b) as u8 as f64;
+            count_inside(&positions[..n - 2], a, b) as f64 * time_step + last_inside * last_step
+        }
+    }
+}
+
+/// Occupation time of `domain` over `duration`, simulated in fixed-size chunks
+/// so that only one chunk of the path is held in memory at a time.
+///
+/// `simulate_chunk(start, duration)` returns the times and positions of a path
+/// started at `start`. Each chunk restarts from the last position of the previous
+/// one, so this is only exact for Markov processes. The left Riemann sums of the
+/// chunks add up to that of the whole path, because each chunk's last position is
+/// the next chunk's first.
+pub(crate) fn chunked_occupation_time<F>(
+    start_position: f64,
+    domain: (f64, f64),
+    duration: f64,
+    time_step: f64,
+    mut simulate_chunk: F,
+) -> XPyResult<f64>
+where
+    F: FnMut(f64, f64) -> XPyResult<(Vec<f64>, Vec<f64>)>,
+{
+    if domain.0 >= domain.1 {
+        return Err(XPyError::ValueError(format!(
+            "domain must satisfy a < b, got {domain:?}"
+        )));
+    }
+    let mut elapsed = 0.0;
+    let mut position = start_position;
+    let mut total = 0.0;
+    while duration - elapsed > 1e-9 * time_step {
+        let chunk = (OCCUPATION_CHUNK_STEPS as f64 * time_step).min(duration - elapsed);
+        let (times, positions) = simulate_chunk(position, chunk)?;
+        let last_step = match times.as_slice() {
+            [.., previous, last] => last - previous,
+            _ => 0.0,
+        };
+        total += occupation_time(&positions, domain, time_step, last_step);
+        match (times.last(), positions.last()) {
+            (Some(&t), Some(&x)) if t > 0.0 => {
+                elapsed += t;
+                position = x;
+            }
+            _ => break,
+        }
+    }
+    Ok(total)
+}
+
+/// First passage time out of `domain`, simulated in chunks whose length doubles
+/// up to `MAX_CHUNK_STEPS` until the path exits or `max_duration` is exhausted.
+///
+/// `simulate_chunk(start, duration)` returns the times and positions of a path
+/// started at `start`. Each chunk restarts from the last position of the previous
+/// one, so this is only exact for Markov processes.
+pub(crate) fn chunked_fpt<F>(
+    start_position: f64,
+    domain: (f64, f64),
+    max_duration: f64,
+    time_step: f64,
+    mut simulate_chunk: F,
+) -> XPyResult<Option<f64>>
+where
+    F: FnMut(f64, f64) -> XPyResult<(Vec<f64>, Vec<f64>)>,
+{
+    let (a, b) = domain;
+    let mut elapsed = 0.0;
+    let mut position = start_position;
+    let mut steps = INITIAL_CHUNK_STEPS;
+    while max_duration - elapsed > 1e-9 * time_step {
+        let duration = (steps as f64 * time_step).min(max_duration - elapsed);
+        let (times, positions) = simulate_chunk(position, duration)?;
+        if let Some(index) = first_exit_index(&positions, a, b) {
+            return Ok(Some(elapsed + times[index]));
+        }
+        match (times.last(), positions.last()) {
+            (Some(&t), Some(&x)) if t > 0.0 => {
+                elapsed += t;
+                position = x;
+            }
+            _ => break,
+        }
+        steps = (steps * 2).min(MAX_CHUNK_STEPS);
+    }
+    Ok(None)
+}
+
+/// First passage times of `particles` independent paths, computed in parallel
+/// by `fpt`, with NaN for paths that do not leave the domain in time.
+pub(crate) fn fpt_batch<F>(particles: usize, fpt: F) -> XPyResult<Vec<f64>>
+where
+    F: Fn() -> XPyResult<Option<f64>> + Sync,
+{
+    (0..particles)
+        .into_par_iter()
+        .map(|_| Ok(fpt()?.unwrap_or(f64::NAN)))
+        .collect()
+}
+
+/// Mean of `(x - center)^order` over `values`.
+///
+/// The order is dispatched once, outside the loop, so the low orders used by the
+/// mean, MSD, skewness and kurtosis reduce with plain multiplications.
+pub(crate) fn mean_power(values: &[f64], center: f64, order: i32) -> f64 {
+    #[inline(always)]
+    fn mean_of(values: &[f64], f: impl Fn(f64) -> f64) -> f64 {
+        values.iter().map(|&x| f(x)).sum::<f64>() / values.len() as f64
+    }
+
+    match order {
+        0 => 1.0,
+        1 => mean_of(values, |x| x - center),
+        2 => mean_of(values, |x| {
+            let d = x - center;
+            d * d
+        }),
+        3 => mean_of(values, |x| {
+            let d = x - center;
+            d * d * d
+        }),
+        4 => mean_of(values, |x| {
+            let d = x - center;
+            let d2 = d * d;
+            d2 * d2
+        }),
+        _ => mean_of(values, |x| (x - center).powi(order)),
+    }
+}
+
+/// Time-averaged squared displacement of a uniformly sampled path at a lag of
+/// `lag` samples, as a shifted sum over every start index.
+pub(crate) fn lagged_square_mean(positions: &[f64], lag: usize) -> f64 {
+    let count = positions.len().saturating_sub(lag);
+    if count == 0 {
+        return f64::NAN;
+    }
+    positions[lag..]
+        .iter()
+        .zip(positions)
+        .map(|(&later, &earlier)| {
+            let d = later - earlier;
+            d * d
+        })
+        .sum::<f64>()
+        / count as f64
+}
+
+/// Number of samples spanned by the lag `delta` on a grid of `time_step`, rounded
+/// to the nearest whole step.
+pub(crate) fn tamsd_lag(
+    py: Python<'_>,
+    duration: f64,
+    delta: f64,
+    time_step: f64,
+) -> XPyResult<usize> {
+    if !(delta.is_finite() && delta >= time_step * (1.0 - 1e-9) && delta < duration) {
+        return Err(XPyError::InvalidArgument(format!(
+            "delta must be at least time_step and less than duration, got {}",
+            float_str(py, delta)
+        )));
+    }
+    Ok(((delta / time_step).round() as usize).max(1))
+}
+
+/// Time-averaged squared displacement at every lag in `lags`, in samples, all
+/// computed from the one path sampled by `simulate`.
+pub(crate) fn tamsd_curve<F>(lags: &[usize], simulate: F) -> XPyResult<Vec<f64>>
+where
+    F: FnOnce() -> XPyResult<(Vec<f64>, Vec<f64>)>,
+{
+    let (_, positions) = simulate()?;
+    Ok(lags
+        .par_iter()
+        .map(|&lag| lagged_square_mean(&positions, lag))
+        .collect())
+}
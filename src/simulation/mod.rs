@@ -1,10 +1,14 @@
 #![allow(clippy::too_many_arguments)]
 
-use numpy::{IntoPyArray, Ix1, PyArray};
+use crate::{XPyError, XPyResult};
+use numpy::{IntoPyArray, Ix1, Ix2, PyArray};
 use pyo3::prelude::*;
+use rayon::{ThreadPool, ThreadPoolBuilder};
+use std::sync::{Arc, Mutex, PoisonError};
 
 mod continuous;
 pub use continuous::*;
+mod kernels;
 mod processes;
 pub use processes::*;
 
@@ -22,7 +26,17 @@ pub(crate) fn call_py_func(func: &Py<PyAny>, args: (f64, f64)) -> f64 {
     }
 }
 
-pub(crate) type PyArrayPair<'py> = (Bound<'py, PyArray<f64, Ix1>>, Bound<'py, PyArray<f64, Ix1>>);
+pub(crate) type PyArrayVector<'py> = Bound<'py, PyArray<f64, Ix1>>;
+
+pub(crate) type PyArrayPair<'py> = (PyArrayVector<'py>, PyArrayVector<'py>);
+
+pub(crate) type PyArrayMatrix<'py> = Bound<'py, PyArray<f64, Ix2>>;
+
+pub(crate) type PyArrayVectorF32<'py> = Bound<'py, PyArray<f32, Ix1>>;
+
+pub(crate) type PyArrayMatrixF32<'py> = Bound<'py, PyArray<f32, Ix2>>;
+
+pub(crate) type PyArrayPairF32<'py> = (PyArrayVectorF32<'py>, PyArrayVectorF32<'py>);
 
 pub(crate) fn vec_to_pyarray(py: Python, time: Vec<f64>, position: Vec<f64>) -> PyArrayPair {
     let time_array = time.into_pyarray(py);
@@ -30,3 +44,53 @@ pub(crate) fn vec_to_pyarray(py: Python, time: Vec<f64>, position: Vec<f64>) ->
 
     (time_array, position_array)
 }
+
+pub(crate) fn vec_to_pyarray_f32(py: Python, time: Vec<f64>, position: Vec<f64>) -> PyArrayPairF32 {
+    let time_array = time.into_iter().map(|t| t as f32).collect::<Vec<_>>().into_pyarray(py);
+    let position_array = position
+        .into_iter()
+        .map(|x| x as f32)
+        .collect::<Vec<_>>()
+        .into_pyarray(py);
+
+    (time_array, position_array)
+}
+
+/// The Rayon pool most recently built for an explicit `n_threads`, with its
+/// thread count. Only this one pool is kept, so repeated calls with the same
+/// count reuse its workers while a sweep over many counts holds at most one idle
+/// pool; a replaced pool shuts its threads down once its last caller returns.
+static THREAD_POOL: Mutex<Option<(usize, Arc<ThreadPool>)>> = Mutex::new(None);
+
+/// A Rayon pool of `n_threads` threads, reusing the cached one when the count matches.
+fn thread_pool(n_threads: usize) -> XPyResult<Arc<ThreadPool>> {
+    let mut cached = THREAD_POOL.lock().unwrap_or_else(PoisonError::into_inner);
+    if let Some((count, pool)) = cached.as_ref()
+        && *count == n_threads
+    {
+        return Ok(Arc::clone(pool));
+    }
+    let pool = ThreadPoolBuilder::new()
+        .num_threads(n_threads)
+        .build()
+        .map(Arc::new)
+        .map_err(|error| XPyError::RuntimeError(error.to_string()))?;
+    *cached = Some((n_threads, Arc::clone(&pool)));
+    Ok(pool)
+}
+
+/// Run `f` on a dedicated Rayon pool of `n_threads` threads, or on the global
+/// pool when `n_threads` is `None`. Parallel iterators started inside `f`,
+/// including those of the upstream estimators, run on the chosen pool. The last
+/// pool used is cached, so consecutive calls with the same count only pay for
+/// spawning its threads once.
+pub(crate) fn in_thread_pool<T, F>(n_threads: Option<usize>, f: F) -> XPyResult<T>
+where
+    T: Send,
+    F: FnOnce() -> XPyResult<T> + Send,
+{
+    match n_threads {
+        None => f(),
+        Some(n_threads) => thread_pool(n_threads)?.install(f),
+    }
+}
@@ -1,8 +1,13 @@
 use crate::{
     XPyResult,
-    simulation::{PyArrayPair, vec_to_pyarray},
+    simulation::{
+        PyArrayPair, PyArrayVector,
+        kernels::{chunked_fpt, chunked_occupation_time, fpt_batch},
+        vec_to_pyarray,
+    },
 };
 use diffusionx::simulation::{continuous::Bm, prelude::*};
+use numpy::IntoPyArray;
 use pyo3::prelude::*;
 #[cfg(feature = "stub_gen")]
 use pyo3_stub_gen::derive::gen_stub_pyfunction;
@@ -58,21 +63,76 @@ pub fn bm_central_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bm_fpt(
+    py: Python<'_>,
     start_position: f64,
     diffusion_coefficient: f64,
     time_step: f64,
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let bm = Bm::new(start_position, diffusion_coefficient)?;
-    let result = bm.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        first_passage(
+            start_position,
+            diffusion_coefficient,
+            time_step,
+            domain,
+            max_duration,
+        )
+    })
+}
+
+/// Get the first passage times of independent Brownian motions, NaN where no passage occurs.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn bm_fpt_batch(
+    py: Python<'_>,
+    start_position: f64,
+    diffusion_coefficient: f64,
+    domain: (f64, f64),
+    particles: usize,
+    time_step: f64,
+    max_duration: f64,
+) -> XPyResult<PyArrayVector<'_>> {
+    let result = py.detach(|| {
+        Bm::new(start_position, diffusion_coefficient)?;
+        fpt_batch(particles, || {
+            first_passage(
+                start_position,
+                diffusion_coefficient,
+                time_step,
+                domain,
+                max_duration,
+            )
+        })
+    })?;
+    Ok(result.into_pyarray(py))
+}
+
+fn first_passage(
+    start_position: f64,
+    diffusion_coefficient: f64,
+    time_step: f64,
+    domain: (f64, f64),
+    max_duration: f64,
+) -> XPyResult<Option<f64>> {
+    Bm::new(start_position, diffusion_coefficient)?;
+    chunked_fpt(
+        start_position,
+        domain,
+        max_duration,
+        time_step,
+        |start, duration| {
+            let bm = Bm::new(start, diffusion_coefficient)?;
+            Ok(bm.simulate(duration, time_step)?)
+        },
+    )
 }
 
 /// Get the raw moment of the first passage time of Brownian motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bm_fpt_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     diffusion_coefficient: f64,
     domain: (f64, f64),
@@ -81,16 +141,19 @@ pub fn bm_fpt_raw_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let bm = Bm::new(start_position, diffusion_coefficient)?;
-    let fpt = FirstPassageTime::new(&bm, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = Bm::new(start_position, diffusion_coefficient)?;
+        let fpt = FirstPassageTime::new(&bm, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Brownian motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bm_fpt_central_moment(
+    py: Python<'_>,
     start_position: f64,
     diffusion_coefficient: f64,
     domain: (f64, f64),
@@ -99,31 +162,43 @@ pub fn bm_fpt_central_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let bm = Bm::new(start_position, diffusion_coefficient)?;
-    let fpt = FirstPassageTime::new(&bm, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = Bm::new(start_position, diffusion_coefficient)?;
+        let fpt = FirstPassageTime::new(&bm, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Brownian motion.
+///
+/// The path is simulated in chunks, so only one chunk is held in memory at a time.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bm_occupation_time(
+    py: Python<'_>,
     start_position: f64,
     diffusion_coefficient: f64,
     time_step: f64,
     domain: (f64, f64),
     duration: f64,
 ) -> XPyResult<f64> {
-    let bm = Bm::new(start_position, diffusion_coefficient)?;
-    let result = bm.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        occupation(
+            start_position,
+            diffusion_coefficient,
+            time_step,
+            domain,
+            duration,
+        )
+    })
 }
 
 /// Get the raw moment of the occupation time of Brownian motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bm_occupation_time_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     diffusion_coefficient: f64,
     domain: (f64, f64),
@@ -132,16 +207,19 @@ pub fn bm_occupation_time_raw_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let bm = Bm::new(start_position, diffusion_coefficient)?;
-    let oc = OccupationTime::new(&bm, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = Bm::new(start_position, diffusion_coefficient)?;
+        let oc = OccupationTime::new(&bm, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Brownian motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bm_occupation_time_central_moment(
+    py: Python<'_>,
     start_position: f64,
     diffusion_coefficient: f64,
     domain: (f64, f64),
@@ -150,10 +228,12 @@ pub fn bm_occupation_time_central_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let bm = Bm::new(start_position, diffusion_coefficient)?;
-    let oc = OccupationTime::new(&bm, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = Bm::new(start_position, diffusion_coefficient)?;
+        let oc = OccupationTime::new(&bm, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean square displacement of Brownian motion.
@@ -250,3 +330,23 @@ pub fn bm_frac_central_moment(
     let result = bm.frac_central_moment(duration, order, particles, time_step)?;
     Ok(result)
 }
+
+fn occupation(
+    start_position: f64,
+    diffusion_coefficient: f64,
+    time_step: f64,
+    domain: (f64, f64),
+    duration: f64,
+) -> XPyResult<f64> {
+    Bm::new(start_position, diffusion_coefficient)?;
+    chunked_occupation_time(
+        start_position,
+        domain,
+        duration,
+        time_step,
+        |start, duration| {
+            let bm = Bm::new(start, diffusion_coefficient)?;
+            Ok(bm.simulate(duration, time_step)?)
+        },
+    )
+}
@@ -86,32 +86,38 @@ pub fn bb_fpt(time_step: f64, domain: (f64, f64), max_duration: f64) -> XPyResul
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bb_fpt_raw_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let bb = BrownianBridge::new();
-    let fpt = FirstPassageTime::new(&bb, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bb = BrownianBridge::new();
+        let fpt = FirstPassageTime::new(&bb, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Brownian bridge.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bb_fpt_central_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let bb = BrownianBridge::new();
-    let fpt = FirstPassageTime::new(&bb, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bb = BrownianBridge::new();
+        let fpt = FirstPassageTime::new(&bb, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Brownian bridge.
@@ -127,32 +133,38 @@ pub fn bb_occupation_time(domain: (f64, f64), time_step: f64, duration: f64) ->
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bb_occupation_time_raw_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let bb = BrownianBridge::new();
-    let oc = OccupationTime::new(&bb, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bb = BrownianBridge::new();
+        let oc = OccupationTime::new(&bb, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Brownian bridge.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn bb_occupation_time_central_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let bb = BrownianBridge::new();
-    let oc = OccupationTime::new(&bb, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bb = BrownianBridge::new();
+        let oc = OccupationTime::new(&bb, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean square displacement of Brownian bridge.
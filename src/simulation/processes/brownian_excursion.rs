@@ -85,30 +85,36 @@ pub fn be_fpt(time_step: f64, domain: (f64, f64)) -> XPyResult<Option<f64>> {
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn be_fpt_raw_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let be = BrownianExcursion::new();
-    let fpt = FirstPassageTime::new(&be, domain)?;
-    let result = fpt.raw_moment(order, particles, 1.0, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let be = BrownianExcursion::new();
+        let fpt = FirstPassageTime::new(&be, domain)?;
+        let result = fpt.raw_moment(order, particles, 1.0, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Brownian excursion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn be_fpt_central_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let be = BrownianExcursion::new();
-    let fpt = FirstPassageTime::new(&be, domain)?;
-    let result = fpt.central_moment(order, particles, 1.0, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let be = BrownianExcursion::new();
+        let fpt = FirstPassageTime::new(&be, domain)?;
+        let result = fpt.central_moment(order, particles, 1.0, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Brownian excursion.
@@ -124,32 +130,38 @@ pub fn be_occupation_time(domain: (f64, f64), time_step: f64, duration: f64) ->
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn be_occupation_time_raw_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let be = BrownianExcursion::new();
-    let oc = OccupationTime::new(&be, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let be = BrownianExcursion::new();
+        let oc = OccupationTime::new(&be, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Brownian excursion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn be_occupation_time_central_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let be = BrownianExcursion::new();
-    let oc = OccupationTime::new(&be, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let be = BrownianExcursion::new();
+        let oc = OccupationTime::new(&be, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean square displacement of Brownian excursion.
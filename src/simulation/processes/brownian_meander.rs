@@ -89,75 +89,90 @@ pub fn meander_fpt(time_step: f64, domain: (f64, f64)) -> XPyResult<Option<f64>>
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn meander_fpt_raw_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let bm = BrownianMeander::new();
-    let fpt = FirstPassageTime::new(&bm, domain)?;
-    let result = fpt.raw_moment(order, particles, 1.0, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = BrownianMeander::new();
+        let fpt = FirstPassageTime::new(&bm, domain)?;
+        let result = fpt.raw_moment(order, particles, 1.0, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Brownian meander.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn meander_fpt_central_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let bm = BrownianMeander::new();
-    let fpt = FirstPassageTime::new(&bm, domain)?;
-    let result = fpt.central_moment(order, particles, 1.0, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = BrownianMeander::new();
+        let fpt = FirstPassageTime::new(&bm, domain)?;
+        let result = fpt.central_moment(order, particles, 1.0, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Brownian meander.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn meander_occupation_time(
+    py: Python<'_>,
     domain: (f64, f64),
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let bm = BrownianMeander::new();
-    let result = bm.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = BrownianMeander::new();
+        let result = bm.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of Brownian meander.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn meander_occupation_time_raw_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let bm = BrownianMeander::new();
-    let oc = OccupationTime::new(&bm, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = BrownianMeander::new();
+        let oc = OccupationTime::new(&bm, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Brownian meander.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn meander_occupation_time_central_moment(
+    py: Python<'_>,
     domain: (f64, f64),
     order: i32,
     particles: usize,
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let bm = BrownianMeander::new();
-    let oc = OccupationTime::new(&bm, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let bm = BrownianMeander::new();
+        let oc = OccupationTime::new(&bm, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean square displacement of Brownian meander.
@@ -88,20 +88,24 @@ pub fn cauchy_frac_central_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn cauchy_fpt(
+    py: Python<'_>,
     start_position: f64,
     time_step: f64,
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let cauchy = Cauchy::new(start_position);
-    let result = cauchy.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = Cauchy::new(start_position);
+        let result = cauchy.fpt(domain, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the first passage time of Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn cauchy_fpt_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     domain: (f64, f64),
     order: i32,
@@ -109,16 +113,19 @@ pub fn cauchy_fpt_raw_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let cauchy = Cauchy::new(start_position);
-    let fpt = FirstPassageTime::new(&cauchy, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = Cauchy::new(start_position);
+        let fpt = FirstPassageTime::new(&cauchy, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn cauchy_fpt_central_moment(
+    py: Python<'_>,
     start_position: f64,
     domain: (f64, f64),
     order: i32,
@@ -126,30 +133,36 @@ pub fn cauchy_fpt_central_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let cauchy = Cauchy::new(start_position);
-    let fpt = FirstPassageTime::new(&cauchy, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = Cauchy::new(start_position);
+        let fpt = FirstPassageTime::new(&cauchy, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn cauchy_occupation_time(
+    py: Python<'_>,
     start_position: f64,
     domain: (f64, f64),
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let cauchy = Cauchy::new(start_position);
-    let result = cauchy.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = Cauchy::new(start_position);
+        let result = cauchy.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn cauchy_occupation_time_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     domain: (f64, f64),
     order: i32,
@@ -157,16 +170,19 @@ pub fn cauchy_occupation_time_raw_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let cauchy = Cauchy::new(start_position);
-    let oc = OccupationTime::new(&cauchy, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = Cauchy::new(start_position);
+        let oc = OccupationTime::new(&cauchy, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn cauchy_occupation_time_central_moment(
+    py: Python<'_>,
     start_position: f64,
     domain: (f64, f64),
     order: i32,
@@ -174,10 +190,12 @@ pub fn cauchy_occupation_time_central_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let cauchy = Cauchy::new(start_position);
-    let oc = OccupationTime::new(&cauchy, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = Cauchy::new(start_position);
+        let oc = OccupationTime::new(&cauchy, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean square displacement of Cauchy process.
@@ -294,21 +312,25 @@ pub fn asymmetric_cauchy_frac_central_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_cauchy_fpt(
+    py: Python<'_>,
     start_position: f64,
     beta: f64,
     time_step: f64,
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let cauchy = AsymmetricCauchy::new(start_position, beta)?;
-    let result = cauchy.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = AsymmetricCauchy::new(start_position, beta)?;
+        let result = cauchy.fpt(domain, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the first passage time of asymmetric Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_cauchy_fpt_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     beta: f64,
     domain: (f64, f64),
@@ -317,16 +339,19 @@ pub fn asymmetric_cauchy_fpt_raw_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let cauchy = AsymmetricCauchy::new(start_position, beta)?;
-    let fpt = FirstPassageTime::new(&cauchy, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = AsymmetricCauchy::new(start_position, beta)?;
+        let fpt = FirstPassageTime::new(&cauchy, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of asymmetric Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_cauchy_fpt_central_moment(
+    py: Python<'_>,
     start_position: f64,
     beta: f64,
     domain: (f64, f64),
@@ -335,31 +360,37 @@ pub fn asymmetric_cauchy_fpt_central_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let cauchy = AsymmetricCauchy::new(start_position, beta)?;
-    let fpt = FirstPassageTime::new(&cauchy, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = AsymmetricCauchy::new(start_position, beta)?;
+        let fpt = FirstPassageTime::new(&cauchy, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of asymmetric Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_cauchy_occupation_time(
+    py: Python<'_>,
     start_position: f64,
     beta: f64,
     domain: (f64, f64),
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let cauchy = AsymmetricCauchy::new(start_position, beta)?;
-    let result = cauchy.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = AsymmetricCauchy::new(start_position, beta)?;
+        let result = cauchy.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of asymmetric Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_cauchy_occupation_time_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     beta: f64,
     domain: (f64, f64),
@@ -368,16 +399,19 @@ pub fn asymmetric_cauchy_occupation_time_raw_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let cauchy = AsymmetricCauchy::new(start_position, beta)?;
-    let oc = OccupationTime::new(&cauchy, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = AsymmetricCauchy::new(start_position, beta)?;
+        let oc = OccupationTime::new(&cauchy, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of asymmetric Cauchy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_cauchy_occupation_time_central_moment(
+    py: Python<'_>,
     start_position: f64,
     beta: f64,
     domain: (f64, f64),
@@ -386,10 +420,12 @@ pub fn asymmetric_cauchy_occupation_time_central_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let cauchy = AsymmetricCauchy::new(start_position, beta)?;
-    let oc = OccupationTime::new(&cauchy, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let cauchy = AsymmetricCauchy::new(start_position, beta)?;
+        let oc = OccupationTime::new(&cauchy, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean square displacement of asymmetric Cauchy process.
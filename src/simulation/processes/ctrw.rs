@@ -105,21 +105,25 @@ pub fn ctrw_frac_central_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ctrw_fpt(
+    py: Python<'_>,
     alpha: f64,
     beta: f64,
     start_position: f64,
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let ctrw = CTRW::new(alpha, beta, start_position)?;
-    let result = ctrw.fpt(domain, max_duration)?;
-    Ok(result)
+    py.detach(|| {
+        let ctrw = CTRW::new(alpha, beta, start_position)?;
+        let result = ctrw.fpt(domain, max_duration)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the first passage time of CTRW.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ctrw_fpt_raw_moment(
+    py: Python<'_>,
     alpha: f64,
     beta: f64,
     start_position: f64,
@@ -128,16 +132,19 @@ pub fn ctrw_fpt_raw_moment(
     particles: usize,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let ctrw = CTRW::new(alpha, beta, start_position)?;
-    let fpt = FirstPassageTime::new(&ctrw, domain)?;
-    let result = fpt.raw_moment_p(order, particles, max_duration)?;
-    Ok(result)
+    py.detach(|| {
+        let ctrw = CTRW::new(alpha, beta, start_position)?;
+        let fpt = FirstPassageTime::new(&ctrw, domain)?;
+        let result = fpt.raw_moment_p(order, particles, max_duration)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of CTRW.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ctrw_fpt_central_moment(
+    py: Python<'_>,
     alpha: f64,
     beta: f64,
     start_position: f64,
@@ -146,31 +153,37 @@ pub fn ctrw_fpt_central_moment(
     particles: usize,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let ctrw = CTRW::new(alpha, beta, start_position)?;
-    let fpt = FirstPassageTime::new(&ctrw, domain)?;
-    let result = fpt.central_moment_p(order, particles, max_duration)?;
-    Ok(result)
+    py.detach(|| {
+        let ctrw = CTRW::new(alpha, beta, start_position)?;
+        let fpt = FirstPassageTime::new(&ctrw, domain)?;
+        let result = fpt.central_moment_p(order, particles, max_duration)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of CTRW.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ctrw_occupation_time(
+    py: Python<'_>,
     alpha: f64,
     beta: f64,
     start_position: f64,
     domain: (f64, f64),
     duration: f64,
 ) -> XPyResult<f64> {
-    let ctrw = CTRW::new(alpha, beta, start_position)?;
-    let result = ctrw.occupation_time(domain, duration)?;
-    Ok(result)
+    py.detach(|| {
+        let ctrw = CTRW::new(alpha, beta, start_position)?;
+        let result = ctrw.occupation_time(domain, duration)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of CTRW.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ctrw_occupation_time_raw_moment(
+    py: Python<'_>,
     alpha: f64,
     beta: f64,
     start_position: f64,
@@ -179,16 +192,19 @@ pub fn ctrw_occupation_time_raw_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let ctrw = CTRW::new(alpha, beta, start_position)?;
-    let oc = OccupationTime::new(&ctrw, domain, duration)?;
-    let result = oc.raw_moment_p(order, particles)?;
-    Ok(result)
+    py.detach(|| {
+        let ctrw = CTRW::new(alpha, beta, start_position)?;
+        let oc = OccupationTime::new(&ctrw, domain, duration)?;
+        let result = oc.raw_moment_p(order, particles)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of CTRW.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ctrw_occupation_time_central_moment(
+    py: Python<'_>,
     alpha: f64,
     beta: f64,
     start_position: f64,
@@ -197,10 +213,12 @@ pub fn ctrw_occupation_time_central_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let ctrw = CTRW::new(alpha, beta, start_position)?;
-    let oc = OccupationTime::new(&ctrw, domain, duration)?;
-    let result = oc.central_moment_p(order, particles)?;
-    Ok(result)
+    py.detach(|| {
+        let ctrw = CTRW::new(alpha, beta, start_position)?;
+        let oc = OccupationTime::new(&ctrw, domain, duration)?;
+        let result = oc.central_moment_p(order, particles)?;
+        Ok(result)
+    })
 }
 
 /// Get the mean of CTRW.
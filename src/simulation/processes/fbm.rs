@@ -1,31 +1,195 @@
 use crate::{
-    XPyResult,
-    simulation::{PyArrayPair, vec_to_pyarray},
+    XPyError, XPyResult,
+    simulation::{
+        PyArrayMatrix, PyArrayMatrixF32, PyArrayPair, PyArrayPairF32, PyArrayVector,
+        PyArrayVectorF32,
+        kernels::{
+            first_exit_index, fpt_batch, lagged_square_mean, mean_power, occupation_time, tamsd_lag,
+        },
+        vec_to_pyarray, vec_to_pyarray_f32,
+    },
+    validation::{
+        extract_real, float_str, validate_domain, validate_positive_float,
+        validate_positive_integer,
+    },
 };
 use diffusionx::simulation::{continuous::FBm, prelude::*};
+use numpy::{IntoPyArray, ndarray::Array2};
 use pyo3::prelude::*;
 #[cfg(feature = "stub_gen")]
 use pyo3_stub_gen::derive::gen_stub_pyfunction;
+use rayon::prelude::*;
+
+/// Validate and convert the FBm constructor parameters.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_validate_params(
+    start_position: &Bound<'_, PyAny>,
+    hurst_exponent: &Bound<'_, PyAny>,
+) -> XPyResult<(f64, f64)> {
+    let py = hurst_exponent.py();
+    let start_position = extract_real(start_position)?;
+    let hurst_exponent = extract_real(hurst_exponent)?;
+    if !(0.0 < hurst_exponent && hurst_exponent < 1.0) {
+        return Err(XPyError::InvalidArgument(format!(
+            "hurst_exponent must be in the range (0, 1), got {}",
+            float_str(py, hurst_exponent)
+        )));
+    }
+    Ok((start_position, hurst_exponent))
+}
 
 /// Simulate FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
-pub fn fbm_simulate(
-    py: Python<'_>,
+pub fn fbm_simulate<'py>(
+    py: Python<'py>,
+    start_position: f64,
+    hurst_exponent: f64,
+    duration: &Bound<'py, PyAny>,
+    time_step: &Bound<'py, PyAny>,
+) -> XPyResult<PyArrayPair<'py>> {
+    let duration = validate_positive_float(duration, "duration")?;
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let (times, positions) = py.detach(|| -> XPyResult<_> {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        Ok(fbm.simulate(duration, time_step)?)
+    })?;
+    Ok(vec_to_pyarray(py, times, positions))
+}
+
+/// Simulate FBm, returning single-precision times and positions.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_simulate_f32<'py>(
+    py: Python<'py>,
     start_position: f64,
     hurst_exponent: f64,
+    duration: &Bound<'py, PyAny>,
+    time_step: &Bound<'py, PyAny>,
+) -> XPyResult<PyArrayPairF32<'py>> {
+    let duration = validate_positive_float(duration, "duration")?;
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let (times, positions) = py.detach(|| -> XPyResult<_> {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        Ok(fbm.simulate(duration, time_step)?)
+    })?;
+    Ok(vec_to_pyarray_f32(py, times, positions))
+}
+
+/// Simulate `particles` independent FBm paths into one row-major matrix, casting
+/// each position with `cast` as it is written.
+fn simulate_batch_rows<T>(
+    fbm: &FBm,
     duration: f64,
     time_step: f64,
-) -> XPyResult<PyArrayPair<'_>> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let (times, positions) = fbm.simulate(duration, time_step)?;
-    Ok(vec_to_pyarray(py, times, positions))
+    particles: usize,
+    cast: impl Fn(f64) -> T + Sync,
+) -> XPyResult<(Vec<f64>, Array2<T>)>
+where
+    T: Copy + Default + Send,
+{
+    let (times, first) = fbm.simulate(duration, time_step)?;
+    let steps = times.len();
+    let mut data = vec![T::default(); particles * steps];
+    if let Some((head, rest)) = data.split_at_mut_checked(steps)
+        && steps > 0
+    {
+        head.iter_mut().zip(&first).for_each(|(out, &x)| *out = cast(x));
+        rest.par_chunks_mut(steps).try_for_each(|row| {
+            let (_, positions) = fbm.simulate(duration, time_step)?;
+            if positions.len() != steps {
+                return Err(XPyError::ValueError(
+                    "simulate returned paths of different lengths".to_string(),
+                ));
+            }
+            row.iter_mut().zip(&positions).for_each(|(out, &x)| *out = cast(x));
+            Ok(())
+        })?;
+    }
+    let positions = Array2::from_shape_vec((particles, steps), data)
+        .map_err(|error| XPyError::ValueError(error.to_string()))?;
+    Ok((times, positions))
+}
+
+/// Simulate independent FBm paths, returning the shared times and one row of positions per particle.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_simulate_batch<'py>(
+    py: Python<'py>,
+    start_position: f64,
+    hurst_exponent: f64,
+    duration: &Bound<'py, PyAny>,
+    time_step: &Bound<'py, PyAny>,
+    particles: &Bound<'py, PyAny>,
+) -> XPyResult<(PyArrayVector<'py>, PyArrayMatrix<'py>)> {
+    let duration = validate_positive_float(duration, "duration")?;
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let particles = validate_positive_integer(particles, "particles")?;
+    let (times, positions) = py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        simulate_batch_rows(&fbm, duration, time_step, particles, |x| x)
+    })?;
+    Ok((times.into_pyarray(py), positions.into_pyarray(py)))
+}
+
+/// Simulate independent FBm paths, returning single-precision times and positions.
+///
+/// Each path is generated in double precision and narrowed row by row, so the
+/// full double-precision matrix is never materialised.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_simulate_batch_f32<'py>(
+    py: Python<'py>,
+    start_position: f64,
+    hurst_exponent: f64,
+    duration: &Bound<'py, PyAny>,
+    time_step: &Bound<'py, PyAny>,
+    particles: &Bound<'py, PyAny>,
+) -> XPyResult<(PyArrayVectorF32<'py>, PyArrayMatrixF32<'py>)> {
+    let duration = validate_positive_float(duration, "duration")?;
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let particles = validate_positive_integer(particles, "particles")?;
+    let (times, positions) = py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        simulate_batch_rows(&fbm, duration, time_step, particles, |x| x as f32)
+    })?;
+    let times = times.into_iter().map(|t| t as f32).collect::<Vec<_>>();
+    Ok((times.into_pyarray(py), positions.into_pyarray(py)))
+}
+
+/// Simulate independent FBm paths and return the final position of each.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_endpoints<'py>(
+    py: Python<'py>,
+    start_position: f64,
+    hurst_exponent: f64,
+    duration: &Bound<'py, PyAny>,
+    time_step: &Bound<'py, PyAny>,
+    particles: &Bound<'py, PyAny>,
+) -> XPyResult<PyArrayVector<'py>> {
+    let duration = validate_positive_float(duration, "duration")?;
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let particles = validate_positive_integer(particles, "particles")?;
+    let result = py.detach(|| -> XPyResult<Vec<f64>> {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        (0..particles)
+            .into_par_iter()
+            .map(|_| {
+                let (_, positions) = fbm.simulate(duration, time_step)?;
+                Ok(positions.last().copied().unwrap_or(start_position))
+            })
+            .collect()
+    })?;
+    Ok(result.into_pyarray(py))
 }
 
 /// Get the raw moment of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
@@ -33,15 +197,18 @@ pub fn fbm_raw_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.raw_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = fbm.raw_moment(duration, order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_central_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
@@ -49,15 +216,18 @@ pub fn fbm_central_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.central_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = fbm.central_moment(duration, order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the fractional raw moment of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_frac_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
@@ -65,15 +235,18 @@ pub fn fbm_frac_raw_moment(
     order: f64,
     particles: usize,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.frac_raw_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = fbm.frac_raw_moment(duration, order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the fractional central moment of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_frac_central_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
@@ -81,30 +254,125 @@ pub fn fbm_frac_central_moment(
     order: f64,
     particles: usize,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.frac_central_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = fbm.frac_central_moment(duration, order, particles, time_step)?;
+        Ok(result)
+    })
+}
+
+/// Get the raw or central moment of FBm from antithetic path pairs.
+///
+/// Exactly `particles` samples are used: when `particles` is odd, the reflection
+/// of the last simulated path is dropped.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_antithetic_moment(
+    py: Python<'_>,
+    start_position: f64,
+    hurst_exponent: f64,
+    duration: f64,
+    time_step: f64,
+    order: i32,
+    central: bool,
+    particles: usize,
+) -> XPyResult<f64> {
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let endpoints: XPyResult<Vec<f64>> = (0..particles.div_ceil(2))
+            .into_par_iter()
+            .map(|_| {
+                let (_, positions) = fbm.simulate(duration, time_step)?;
+                Ok(positions.last().copied().unwrap_or(start_position))
+            })
+            .collect();
+        let values: Vec<f64> = endpoints?
+            .into_iter()
+            .flat_map(|x| [x, 2.0 * start_position - x])
+            .take(particles)
+            .collect();
+        let center = if central {
+            mean_power(&values, 0.0, 1)
+        } else {
+            0.0
+        };
+        Ok(mean_power(&values, center, order))
+    })
 }
 
 /// Get the first passage time of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_fpt(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
-    time_step: f64,
+    time_step: &Bound<'_, PyAny>,
+    domain: &Bound<'_, PyAny>,
+    max_duration: &Bound<'_, PyAny>,
+) -> XPyResult<Option<f64>> {
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let domain = validate_domain(domain, "Fbm FPT")?;
+    let max_duration = validate_positive_float(max_duration, "max_duration")?;
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let (times, positions) = fbm.simulate(max_duration, time_step)?;
+        let result = first_exit_index(&positions, domain.0, domain.1).map(|index| times[index]);
+        Ok(result)
+    })
+}
+
+/// Get the first passage times of independent FBm paths, NaN where no passage occurs.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_fpt_batch<'py>(
+    py: Python<'py>,
+    start_position: f64,
+    hurst_exponent: f64,
+    domain: &Bound<'py, PyAny>,
+    particles: &Bound<'py, PyAny>,
+    time_step: &Bound<'py, PyAny>,
+    max_duration: &Bound<'py, PyAny>,
+) -> XPyResult<PyArrayVector<'py>> {
+    let domain = validate_domain(domain, "Fbm FPT batch")?;
+    let particles = validate_positive_integer(particles, "particles")?;
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let max_duration = validate_positive_float(max_duration, "max_duration")?;
+    let result = py.detach(|| -> XPyResult<Vec<f64>> {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let (a, b) = domain;
+        fpt_batch(particles, || {
+            let (times, positions) = fbm.simulate(max_duration, time_step)?;
+            Ok(first_exit_index(&positions, a, b).map(|index| times[index]))
+        })
+    })?;
+    Ok(result.into_pyarray(py))
+}
+
+/// First passage times of `particles` independent FBm paths, or `None` if any
+/// path stays in `domain` until `max_duration`.
+fn first_passage_times(
+    fbm: &FBm,
     domain: (f64, f64),
+    particles: usize,
+    time_step: f64,
     max_duration: f64,
-) -> XPyResult<Option<f64>> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+) -> XPyResult<Option<Vec<f64>>> {
+    let (a, b) = domain;
+    (0..particles)
+        .into_par_iter()
+        .map(|_| -> XPyResult<Option<f64>> {
+            let (times, positions) = fbm.simulate(max_duration, time_step)?;
+            Ok(first_exit_index(&positions, a, b).map(|index| times[index]))
+        })
+        .collect()
 }
 
 /// Get the raw moment of the first passage time of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_fpt_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     domain: (f64, f64),
@@ -113,16 +381,19 @@ pub fn fbm_fpt_raw_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let fpt = FirstPassageTime::new(&fbm, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = first_passage_times(&fbm, domain, particles, time_step, max_duration)?
+            .map(|times| mean_power(&times, 0.0, order));
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_fpt_central_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     domain: (f64, f64),
@@ -131,31 +402,118 @@ pub fn fbm_fpt_central_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let fpt = FirstPassageTime::new(&fbm, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = first_passage_times(&fbm, domain, particles, time_step, max_duration)?
+            .map(|times| mean_power(&times, mean_power(&times, 0.0, 1), order));
+        Ok(result)
+    })
+}
+
+/// Get the raw and central moments of the first passage time of FBm for every
+/// order in `orders`, all from one sample of first passage times.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_fpt_moments(
+    py: Python<'_>,
+    start_position: f64,
+    hurst_exponent: f64,
+    domain: (f64, f64),
+    orders: Vec<i32>,
+    particles: usize,
+    time_step: f64,
+    max_duration: f64,
+) -> XPyResult<Option<(Vec<f64>, Vec<f64>)>> {
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = first_passage_times(&fbm, domain, particles, time_step, max_duration)?
+            .map(|times| {
+                let mean = mean_power(&times, 0.0, 1);
+                orders
+                    .iter()
+                    .map(|&order| (mean_power(&times, 0.0, order), mean_power(&times, mean, order)))
+                    .unzip()
+            });
+        Ok(result)
+    })
+}
+
+/// Get a moment of the first passage time of FBm at every point of a grid of
+/// domains `(lower[k], upper[k])` and time steps `time_steps[k]`, NaN where some
+/// path does not leave the domain.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_fpt_moment_grid(
+    py: Python<'_>,
+    start_position: f64,
+    hurst_exponent: f64,
+    lower: Vec<f64>,
+    upper: Vec<f64>,
+    time_steps: Vec<f64>,
+    order: i32,
+    central: bool,
+    particles: usize,
+    max_duration: f64,
+) -> XPyResult<PyArrayVector<'_>> {
+    if lower.len() != upper.len() || lower.len() != time_steps.len() {
+        return Err(XPyError::ValueError(
+            "lower, upper and time_steps must have the same length".to_string(),
+        ));
+    }
+    let result = py.detach(|| -> XPyResult<Vec<f64>> {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        lower
+            .par_iter()
+            .zip(&upper)
+            .zip(&time_steps)
+            .map(|((&a, &b), &time_step)| -> XPyResult<f64> {
+                let moment = first_passage_times(&fbm, (a, b), particles, time_step, max_duration)?
+                    .map(|times| {
+                        let center = if central {
+                            mean_power(&times, 0.0, 1)
+                        } else {
+                            0.0
+                        };
+                        mean_power(&times, center, order)
+                    });
+                Ok(moment.unwrap_or(f64::NAN))
+            })
+            .collect()
+    })?;
+    Ok(result.into_pyarray(py))
 }
 
 /// Get the occupation time of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_occupation_time(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
-    time_step: f64,
-    domain: (f64, f64),
-    duration: f64,
+    time_step: &Bound<'_, PyAny>,
+    domain: &Bound<'_, PyAny>,
+    duration: &Bound<'_, PyAny>,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let domain = validate_domain(domain, "Fbm Occupation Time")?;
+    let duration = validate_positive_float(duration, "duration")?;
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let (times, positions) = fbm.simulate(duration, time_step)?;
+        let last_step = match times.as_slice() {
+            [.., previous, last] => last - previous,
+            _ => 0.0,
+        };
+        let result = occupation_time(&positions, domain, time_step, last_step);
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_occupation_time_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     domain: (f64, f64),
@@ -164,16 +522,19 @@ pub fn fbm_occupation_time_raw_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let oc = OccupationTime::new(&fbm, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let oc = OccupationTime::new(&fbm, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_occupation_time_central_moment(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     domain: (f64, f64),
@@ -182,71 +543,120 @@ pub fn fbm_occupation_time_central_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let oc = OccupationTime::new(&fbm, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let oc = OccupationTime::new(&fbm, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean squared displacement of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_tamsd(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
     delta: f64,
     time_step: f64,
-    quad_order: usize,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.tamsd(duration, delta, time_step, quad_order)?;
-    Ok(result)
+    let lag = tamsd_lag(py, duration, delta, time_step)?;
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let (_, positions) = fbm.simulate(duration, time_step)?;
+        Ok(lagged_square_mean(&positions, lag))
+    })
 }
 
 /// Get the effective time-averaged mean squared displacement of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_eatamsd(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
     delta: f64,
     particles: usize,
     time_step: f64,
-    quad_order: usize,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.eatamsd(duration, delta, particles, time_step, quad_order)?;
-    Ok(result)
+    let lag = tamsd_lag(py, duration, delta, time_step)?;
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let values: XPyResult<Vec<f64>> = (0..particles)
+            .into_par_iter()
+            .map(|_| {
+                let (_, positions) = fbm.simulate(duration, time_step)?;
+                Ok(lagged_square_mean(&positions, lag))
+            })
+            .collect();
+        Ok(values?.into_iter().sum::<f64>() / particles as f64)
+    })
 }
 
 /// Get the mean of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_mean(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
     particles: usize,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.mean(duration, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = fbm.mean(duration, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the msd of FBm.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn fbm_msd(
+    py: Python<'_>,
     start_position: f64,
     hurst_exponent: f64,
     duration: f64,
     particles: usize,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let fbm = FBm::new(start_position, hurst_exponent)?;
-    let result = fbm.msd(duration, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let result = fbm.msd(duration, particles, time_step)?;
+        Ok(result)
+    })
+}
+
+/// Get the mean and the msd of FBm from a single ensemble.
+///
+/// Each particle contributes its displacement and squared displacement to one
+/// parallel reduction, so both statistics cost one set of simulations.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn fbm_mean_msd(
+    py: Python<'_>,
+    start_position: f64,
+    hurst_exponent: f64,
+    duration: f64,
+    particles: usize,
+    time_step: f64,
+) -> XPyResult<(f64, f64)> {
+    py.detach(|| {
+        let fbm = FBm::new(start_position, hurst_exponent)?;
+        let (sum, sum_squares) = (0..particles)
+            .into_par_iter()
+            .map(|_| -> XPyResult<(f64, f64)> {
+                let (_, positions) = fbm.simulate(duration, time_step)?;
+                let displacement = positions.last().map_or(0.0, |&x| x - start_position);
+                Ok((displacement, displacement * displacement))
+            })
+            .try_reduce(|| (0.0, 0.0), |(a, a2), (b, b2)| Ok((a + b, a2 + b2)))?;
+        let n = particles as f64;
+        Ok((start_position + sum / n, sum_squares / n))
+    })
 }
@@ -1,11 +1,30 @@
 use crate::{
-    XPyResult,
-    simulation::{PyArrayPair, vec_to_pyarray},
+    XPyError, XPyResult,
+    simulation::{
+        PyArrayPair, PyArrayPairF32, PyArrayVector, in_thread_pool,
+        kernels::{fpt_batch, mean_power, tamsd_curve, tamsd_lag},
+        vec_to_pyarray, vec_to_pyarray_f32,
+    },
 };
 use diffusionx::simulation::{continuous::Gamma, prelude::*};
+use numpy::{IntoPyArray, PyReadwriteArray1};
 use pyo3::prelude::*;
 #[cfg(feature = "stub_gen")]
 use pyo3_stub_gen::derive::gen_stub_pyfunction;
+use rayon::prelude::*;
+
+/// Number of particles simulated between convergence checks of the adaptive
+/// first passage time moment.
+const ADAPTIVE_BATCH: usize = 256;
+
+/// Number of particles the adaptive first passage time moment draws before its
+/// first convergence check, so that a heavy tail missed by one small batch cannot
+/// stop sampling on a spuriously small variance.
+const ADAPTIVE_MIN_PARTICLES: usize = 4 * ADAPTIVE_BATCH;
+
+/// Number of `time_step`s covered by one coarse step of the gamma-bridge first
+/// passage time, before bisection refines the crossing.
+const BRIDGE_COARSE_STEPS: usize = 1024;
 
 /// Simulate Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
@@ -17,94 +36,391 @@ pub fn gamma_simulate(
     duration: f64,
     time_step: f64,
 ) -> XPyResult<PyArrayPair<'_>> {
-    let gamma = Gamma::new(shape, rate)?;
-    let (times, positions) = gamma.simulate(duration, time_step)?;
+    let (times, positions) = py.detach(|| -> XPyResult<_> {
+        let gamma = Gamma::new(shape, rate)?;
+        Ok(gamma.simulate(duration, time_step)?)
+    })?;
     Ok(vec_to_pyarray(py, times, positions))
 }
 
+/// Simulate Gamma, returning single-precision times and positions.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn gamma_simulate_f32(
+    py: Python<'_>,
+    shape: f64,
+    rate: f64,
+    duration: f64,
+    time_step: f64,
+) -> XPyResult<PyArrayPairF32<'_>> {
+    let (times, positions) = py.detach(|| -> XPyResult<_> {
+        let gamma = Gamma::new(shape, rate)?;
+        Ok(gamma.simulate(duration, time_step)?)
+    })?;
+    Ok(vec_to_pyarray_f32(py, times, positions))
+}
+
+/// Simulate Gamma into the caller's `out_times` and `out_positions` buffers and
+/// return the number of samples written. Entries past that count are left as
+/// they were.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn gamma_simulate_into(
+    py: Python<'_>,
+    shape: f64,
+    rate: f64,
+    mut out_times: PyReadwriteArray1<'_, f64>,
+    mut out_positions: PyReadwriteArray1<'_, f64>,
+    duration: f64,
+    time_step: f64,
+) -> XPyResult<usize> {
+    let (times, positions) = py.detach(|| -> XPyResult<_> {
+        let gamma = Gamma::new(shape, rate)?;
+        Ok(gamma.simulate(duration, time_step)?)
+    })?;
+    let not_contiguous = |_| XPyError::ValueError("output arrays must be contiguous".to_string());
+    let out_times = out_times.as_slice_mut().map_err(not_contiguous)?;
+    let out_positions = out_positions.as_slice_mut().map_err(not_contiguous)?;
+    let n = times.len();
+    if out_times.len() < n || out_positions.len() < n {
+        return Err(XPyError::ValueError(format!(
+            "output arrays must hold at least {n} samples, got {} and {}",
+            out_times.len(),
+            out_positions.len()
+        )));
+    }
+    out_times[..n].copy_from_slice(&times);
+    out_positions[..n].copy_from_slice(&positions);
+    Ok(n)
+}
+
 /// Get the raw moment of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, duration, time_step, order, particles, n_threads = None))]
 pub fn gamma_raw_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
     time_step: f64,
     order: i32,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.raw_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let result = gamma.raw_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the central moment of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, duration, time_step, order, particles, n_threads = None))]
 pub fn gamma_central_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
     time_step: f64,
     order: i32,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.central_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let result = gamma.central_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
+}
+
+/// Get the raw or central moments of Gamma for every order in `orders`, all from
+/// one ensemble of `particles` simulated positions at `duration`.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+#[pyo3(signature = (shape, rate, duration, time_step, orders, central, particles, n_threads = None))]
+pub fn gamma_moments(
+    py: Python<'_>,
+    shape: f64,
+    rate: f64,
+    duration: f64,
+    time_step: f64,
+    orders: Vec<i32>,
+    central: bool,
+    particles: usize,
+    n_threads: Option<usize>,
+) -> XPyResult<PyArrayVector<'_>> {
+    let result = py.detach(|| {
+        in_thread_pool(n_threads, || -> XPyResult<Vec<f64>> {
+            let gamma = Gamma::new(shape, rate)?;
+            let positions = (0..particles)
+                .into_par_iter()
+                .map(|_| -> XPyResult<f64> {
+                    let (_, positions) = gamma.simulate(duration, time_step)?;
+                    Ok(positions.last().copied().unwrap_or(0.0))
+                })
+                .collect::<XPyResult<Vec<f64>>>()?;
+            let center = if central {
+                mean_power(&positions, 0.0, 1)
+            } else {
+                0.0
+            };
+            Ok(orders
+                .iter()
+                .map(|&order| mean_power(&positions, center, order))
+                .collect())
+        })
+    })?;
+    Ok(result.into_pyarray(py))
+}
+
+/// Get the raw or central moment of Gamma at every time in `durations`.
+///
+/// Each particle is simulated once up to the longest duration, and its position
+/// at every shorter duration is read off the same path. The durations are expected
+/// to be whole multiples of `time_step`, so each one falls on a sample.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+#[pyo3(signature = (shape, rate, durations, time_step, order, central, particles, n_threads = None))]
+pub fn gamma_moments_over_durations(
+    py: Python<'_>,
+    shape: f64,
+    rate: f64,
+    durations: Vec<f64>,
+    time_step: f64,
+    order: i32,
+    central: bool,
+    particles: usize,
+    n_threads: Option<usize>,
+) -> XPyResult<PyArrayVector<'_>> {
+    let result = py.detach(|| {
+        in_thread_pool(n_threads, || -> XPyResult<Vec<f64>> {
+            let gamma = Gamma::new(shape, rate)?;
+            let longest = durations.iter().copied().fold(0.0, f64::max);
+            let rows = (0..particles)
+                .into_par_iter()
+                .map(|_| -> XPyResult<Vec<f64>> {
+                    let (times, positions) = gamma.simulate(longest, time_step)?;
+                    let last = positions.len().saturating_sub(1);
+                    Ok(durations
+                        .iter()
+                        .map(|&t| {
+                            let index = times.partition_point(|&s| s < t - 1e-9 * time_step);
+                            positions.get(index.min(last)).copied().unwrap_or(0.0)
+                        })
+                        .collect())
+                })
+                .collect::<XPyResult<Vec<Vec<f64>>>>()?;
+            Ok((0..durations.len())
+                .map(|column| {
+                    let positions: Vec<f64> = rows.iter().map(|row| row[column]).collect();
+                    let center = if central {
+                        mean_power(&positions, 0.0, 1)
+                    } else {
+                        0.0
+                    };
+                    mean_power(&positions, center, order)
+                })
+                .collect())
+        })
+    })?;
+    Ok(result.into_pyarray(py))
 }
 
 /// Get the fractional raw moment of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, duration, time_step, order, particles, n_threads = None))]
 pub fn gamma_frac_raw_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
     time_step: f64,
     order: f64,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.frac_raw_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let result = gamma.frac_raw_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the fractional central moment of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, duration, time_step, order, particles, n_threads = None))]
 pub fn gamma_frac_central_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
     time_step: f64,
     order: f64,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.frac_central_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let result = gamma.frac_central_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the first passage time of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn gamma_fpt(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     time_step: f64,
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let gamma = Gamma::new(shape, rate)?;
+        let result = gamma.fpt(domain, max_duration, time_step)?;
+        Ok(result)
+    })
+}
+
+/// Get the first passage time of Gamma without stepping through the whole grid.
+///
+/// The path is advanced in coarse steps of `BRIDGE_COARSE_STEPS` time steps until
+/// it leaves the domain. The crossing is then located to within `time_step` by
+/// bisection: given the values at both ends of an interval, the value at its
+/// midpoint follows the gamma bridge, a Beta-distributed split of the increment.
+/// The result has the same law and resolution as the fine-grid search, with
+/// work proportional to the number of coarse steps plus the bisection depth.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn gamma_fpt_bridge(
+    py: Python<'_>,
+    shape: f64,
+    rate: f64,
+    time_step: f64,
+    domain: (f64, f64),
+    max_duration: f64,
+) -> XPyResult<Option<f64>> {
+    py.detach(|| {
+        let gamma = Gamma::new(shape, rate)?;
+        bridge_fpt(&gamma, domain, max_duration, time_step)
+    })
+}
+
+/// Gamma-bridge first passage time of a Gamma path started at zero.
+///
+/// Gamma paths are non-decreasing, so a path started inside `domain` can only
+/// leave it through the upper bound. Time is tracked in whole grid steps and every
+/// coarse step is a power of two of them, so bisection ends on the `time_step`
+/// grid; a crossing inside the last, partial grid step is reported at
+/// `max_duration`, where the fine grid ends.
+fn bridge_fpt(
+    gamma: &Gamma,
+    domain: (f64, f64),
+    max_duration: f64,
+    time_step: f64,
+) -> XPyResult<Option<f64>> {
+    let (a, b) = domain;
+    if a >= 0.0 || b <= 0.0 {
+        return Ok(Some(0.0));
+    }
+    // The increment of the process over a duration `h`, drawn as a single step.
+    let increment = |h: f64| -> XPyResult<f64> {
+        let (_, positions) = gamma.simulate(h, h)?;
+        Ok(positions.last().copied().unwrap_or(0.0))
+    };
+    // The value at `lower + head` of a bridge from `lower` to `upper` over `head + tail`.
+    let bridge = |lower: f64, upper: f64, head: f64, tail: f64| -> XPyResult<f64> {
+        let (left, right) = (increment(head)?, increment(tail)?);
+        let split = if left + right > 0.0 {
+            left / (left + right)
+        } else {
+            head / (head + tail)
+        };
+        Ok(lower + (upper - lower) * split)
+    };
+    let tolerance = 1e-9 * time_step;
+    let total_steps = ((max_duration - tolerance) / time_step).ceil().max(1.0) as usize;
+    let mut elapsed = 0;
+    let mut position = 0.0;
+    while elapsed < total_steps {
+        let steps = BRIDGE_COARSE_STEPS.min((total_steps - elapsed).next_power_of_two());
+        let next = position + increment(steps as f64 * time_step)?;
+        if next < b {
+            elapsed += steps;
+            position = next;
+            continue;
+        }
+        let (mut start, mut width, mut lower, mut upper) = (elapsed, steps, position, next);
+        while width > 1 {
+            width /= 2;
+            let half = width as f64 * time_step;
+            let middle = bridge(lower, upper, half, half)?;
+            if middle >= b {
+                upper = middle;
+            } else {
+                start += width;
+                lower = middle;
+            }
+        }
+        if start >= total_steps {
+            return Ok(None);
+        }
+        let end = (start + 1) as f64 * time_step;
+        if end <= max_duration + tolerance {
+            return Ok(Some(end));
+        }
+        let head = max_duration - start as f64 * time_step;
+        let value = bridge(lower, upper, head, time_step - head)?;
+        return Ok((value >= b).then_some(max_duration));
+    }
+    Ok(None)
+}
+
+/// Get the first passage times of independent Gamma processes, NaN where no passage occurs.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn gamma_fpt_batch(
+    py: Python<'_>,
+    shape: f64,
+    rate: f64,
+    domain: (f64, f64),
+    particles: usize,
+    time_step: f64,
+    max_duration: f64,
+) -> XPyResult<PyArrayVector<'_>> {
+    let result = py.detach(|| {
+        let gamma = Gamma::new(shape, rate)?;
+        fpt_batch(particles, || Ok(gamma.fpt(domain, max_duration, time_step)?))
+    })?;
+    Ok(result.into_pyarray(py))
 }
 
 /// Get the raw moment of the first passage time of Gamma.
+///
+/// With `tol`, particles are drawn in batches and sampling stops once the
+/// standard error of the estimate falls below `tol` times its magnitude, checked
+/// only after at least `ADAPTIVE_MIN_PARTICLES` particles and using at most
+/// `particles` particles.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, domain, order, particles, time_step, max_duration, n_threads = None, tol = None))]
 pub fn gamma_fpt_raw_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     domain: (f64, f64),
@@ -112,17 +428,77 @@ pub fn gamma_fpt_raw_moment(
     particles: usize,
     time_step: f64,
     max_duration: f64,
+    n_threads: Option<usize>,
+    tol: Option<f64>,
 ) -> XPyResult<Option<f64>> {
-    let gamma = Gamma::new(shape, rate)?;
-    let fpt = FirstPassageTime::new(&gamma, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            if let Some(tol) = tol {
+                return adaptive_fpt_raw_moment(
+                    &gamma,
+                    domain,
+                    order,
+                    particles,
+                    time_step,
+                    max_duration,
+                    tol,
+                );
+            }
+            let fpt = FirstPassageTime::new(&gamma, domain)?;
+            let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+            Ok(result)
+        })
+    })
+}
+
+/// Raw FPT moment estimated from batches of `ADAPTIVE_BATCH` particles, with a
+/// running Welford mean and variance checked after every batch once at least
+/// `ADAPTIVE_MIN_PARTICLES` particles have been drawn.
+fn adaptive_fpt_raw_moment(
+    gamma: &Gamma,
+    domain: (f64, f64),
+    order: i32,
+    max_particles: usize,
+    time_step: f64,
+    max_duration: f64,
+    tol: f64,
+) -> XPyResult<Option<f64>> {
+    let mut count = 0usize;
+    let mut mean = 0.0;
+    let mut m2 = 0.0;
+    while count < max_particles {
+        let batch = ADAPTIVE_BATCH.min(max_particles - count);
+        let Some(times) = (0..batch)
+            .into_par_iter()
+            .map(|_| -> XPyResult<Option<f64>> { Ok(gamma.fpt(domain, max_duration, time_step)?) })
+            .collect::<XPyResult<Option<Vec<f64>>>>()?
+        else {
+            return Ok(None);
+        };
+        for t in times {
+            let x = t.powi(order);
+            count += 1;
+            let delta = x - mean;
+            mean += delta / count as f64;
+            m2 += delta * (x - mean);
+        }
+        if count >= ADAPTIVE_MIN_PARTICLES {
+            let standard_error = (m2 / ((count - 1) * count) as f64).sqrt();
+            if standard_error <= tol * mean.abs() {
+                break;
+            }
+        }
+    }
+    Ok(Some(mean))
 }
 
 /// Get the central moment of the first passage time of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, domain, order, particles, time_step, max_duration, n_threads = None))]
 pub fn gamma_fpt_central_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     domain: (f64, f64),
@@ -130,32 +506,42 @@ pub fn gamma_fpt_central_moment(
     particles: usize,
     time_step: f64,
     max_duration: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<Option<f64>> {
-    let gamma = Gamma::new(shape, rate)?;
-    let fpt = FirstPassageTime::new(&gamma, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let fpt = FirstPassageTime::new(&gamma, domain)?;
+            let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the occupation time of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn gamma_occupation_time(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     domain: (f64, f64),
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let gamma = Gamma::new(shape, rate)?;
+        let result = gamma.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, domain, order, particles, time_step, duration, n_threads = None))]
 pub fn gamma_occupation_time_raw_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     domain: (f64, f64),
@@ -163,17 +549,24 @@ pub fn gamma_occupation_time_raw_moment(
     particles: usize,
     time_step: f64,
     duration: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let oc = OccupationTime::new(&gamma, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let oc = OccupationTime::new(&gamma, domain, duration)?;
+            let result = oc.raw_moment(order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the central moment of the occupation time of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, domain, order, particles, time_step, duration, n_threads = None))]
 pub fn gamma_occupation_time_central_moment(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     domain: (f64, f64),
@@ -181,17 +574,23 @@ pub fn gamma_occupation_time_central_moment(
     particles: usize,
     time_step: f64,
     duration: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let oc = OccupationTime::new(&gamma, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let oc = OccupationTime::new(&gamma, domain, duration)?;
+            let result = oc.central_moment(order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the time-averaged mean squared displacement of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn gamma_tamsd(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
@@ -199,15 +598,42 @@ pub fn gamma_tamsd(
     time_step: f64,
     quad_order: usize,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.tamsd(duration, delta, time_step, quad_order)?;
-    Ok(result)
+    py.detach(|| {
+        let gamma = Gamma::new(shape, rate)?;
+        let result = gamma.tamsd(duration, delta, time_step, quad_order)?;
+        Ok(result)
+    })
+}
+
+/// Get the time-averaged mean squared displacement of Gamma at every lag in
+/// `deltas`, all from one simulated path.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn gamma_tamsd_curve(
+    py: Python<'_>,
+    shape: f64,
+    rate: f64,
+    duration: f64,
+    deltas: Vec<f64>,
+    time_step: f64,
+) -> XPyResult<PyArrayVector<'_>> {
+    let lags = deltas
+        .iter()
+        .map(|&delta| tamsd_lag(py, duration, delta, time_step))
+        .collect::<XPyResult<Vec<usize>>>()?;
+    let result = py.detach(|| {
+        let gamma = Gamma::new(shape, rate)?;
+        tamsd_curve(&lags, || Ok(gamma.simulate(duration, time_step)?))
+    })?;
+    Ok(result.into_pyarray(py))
 }
 
 /// Get the effective time-averaged mean squared displacement of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, duration, delta, particles, time_step, quad_order, n_threads = None))]
 pub fn gamma_eatamsd(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
@@ -215,38 +641,57 @@ pub fn gamma_eatamsd(
     particles: usize,
     time_step: f64,
     quad_order: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.eatamsd(duration, delta, particles, time_step, quad_order)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let result = gamma.eatamsd(duration, delta, particles, time_step, quad_order)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the mean of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, duration, particles, time_step, n_threads = None))]
 pub fn gamma_mean(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
     particles: usize,
     time_step: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.mean(duration, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let result = gamma.mean(duration, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the msd of Gamma.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (shape, rate, duration, particles, time_step, n_threads = None))]
 pub fn gamma_msd(
+    py: Python<'_>,
     shape: f64,
     rate: f64,
     duration: f64,
     particles: usize,
     time_step: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gamma = Gamma::new(shape, rate)?;
-    let result = gamma.msd(duration, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gamma = Gamma::new(shape, rate)?;
+            let result = gamma.msd(duration, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
@@ -1,11 +1,17 @@
 use crate::{
     XPyResult,
-    simulation::{PyArrayPair, vec_to_pyarray},
+    simulation::{
+        PyArrayPair, PyArrayVector, in_thread_pool,
+        kernels::{chunked_fpt, fpt_batch, mean_power, tamsd_curve, tamsd_lag},
+        vec_to_pyarray,
+    },
 };
 use diffusionx::simulation::{continuous::GeometricBm, prelude::*};
+use numpy::IntoPyArray;
 use pyo3::prelude::*;
 #[cfg(feature = "stub_gen")]
 use pyo3_stub_gen::derive::gen_stub_pyfunction;
+use rayon::prelude::*;
 
 /// Simulate Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
@@ -18,15 +24,19 @@ pub fn gb_simulate(
     duration: f64,
     time_step: f64,
 ) -> XPyResult<PyArrayPair<'_>> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let (times, positions) = gb.simulate(duration, time_step)?;
+    let (times, positions) = py.detach(|| -> XPyResult<_> {
+        let gb = GeometricBm::new(start_position, mu, sigma)?;
+        Ok(gb.simulate(duration, time_step)?)
+    })?;
     Ok(vec_to_pyarray(py, times, positions))
 }
 
 /// Get the raw moment of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, time_step, order, particles, n_threads = None))]
 pub fn gb_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -34,16 +44,23 @@ pub fn gb_raw_moment(
     time_step: f64,
     order: i32,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.raw_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let result = gb.raw_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the central moment of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, time_step, order, particles, n_threads = None))]
 pub fn gb_central_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -51,16 +68,64 @@ pub fn gb_central_moment(
     time_step: f64,
     order: i32,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.central_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let result = gb.central_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
+}
+
+/// Get the raw or central moments of Geometric Brownian Motion for every order in
+/// `orders`, all from one ensemble of `particles` simulated positions at `duration`.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, time_step, orders, central, particles, n_threads = None))]
+pub fn gb_moments(
+    py: Python<'_>,
+    start_position: f64,
+    mu: f64,
+    sigma: f64,
+    duration: f64,
+    time_step: f64,
+    orders: Vec<i32>,
+    central: bool,
+    particles: usize,
+    n_threads: Option<usize>,
+) -> XPyResult<PyArrayVector<'_>> {
+    let result = py.detach(|| {
+        in_thread_pool(n_threads, || -> XPyResult<Vec<f64>> {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let positions = (0..particles)
+                .into_par_iter()
+                .map(|_| -> XPyResult<f64> {
+                    let (_, positions) = gb.simulate(duration, time_step)?;
+                    Ok(positions.last().copied().unwrap_or(start_position))
+                })
+                .collect::<XPyResult<Vec<f64>>>()?;
+            let center = if central {
+                mean_power(&positions, 0.0, 1)
+            } else {
+                0.0
+            };
+            Ok(orders
+                .iter()
+                .map(|&order| mean_power(&positions, center, order))
+                .collect())
+        })
+    })?;
+    Ok(result.into_pyarray(py))
 }
 
 /// Get the fractional raw moment of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, time_step, order, particles, n_threads = None))]
 pub fn gb_frac_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -68,16 +133,23 @@ pub fn gb_frac_raw_moment(
     time_step: f64,
     order: f64,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.frac_raw_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let result = gb.frac_raw_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the fractional central moment of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, time_step, order, particles, n_threads = None))]
 pub fn gb_frac_central_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -85,16 +157,57 @@ pub fn gb_frac_central_moment(
     time_step: f64,
     order: f64,
     particles: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.frac_central_moment(duration, order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let result = gb.frac_central_moment(duration, order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the first passage time of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn gb_fpt(
+    py: Python<'_>,
+    start_position: f64,
+    mu: f64,
+    sigma: f64,
+    time_step: f64,
+    domain: (f64, f64),
+    max_duration: f64,
+) -> XPyResult<Option<f64>> {
+    py.detach(|| {
+        first_passage(start_position, mu, sigma, time_step, domain, max_duration)
+    })
+}
+
+/// Get the first passage times of independent Geometric Brownian Motions, NaN where no passage occurs.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn gb_fpt_batch(
+    py: Python<'_>,
+    start_position: f64,
+    mu: f64,
+    sigma: f64,
+    domain: (f64, f64),
+    particles: usize,
+    time_step: f64,
+    max_duration: f64,
+) -> XPyResult<PyArrayVector<'_>> {
+    let result = py.detach(|| {
+        GeometricBm::new(start_position, mu, sigma)?;
+        fpt_batch(particles, || {
+            first_passage(start_position, mu, sigma, time_step, domain, max_duration)
+        })
+    })?;
+    Ok(result.into_pyarray(py))
+}
+
+fn first_passage(
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -102,15 +215,25 @@ pub fn gb_fpt(
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    GeometricBm::new(start_position, mu, sigma)?;
+    chunked_fpt(
+        start_position,
+        domain,
+        max_duration,
+        time_step,
+        |start, duration| {
+            let gb = GeometricBm::new(start, mu, sigma)?;
+            Ok(gb.simulate(duration, time_step)?)
+        },
+    )
 }
 
 /// Get the raw moment of the first passage time of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, domain, order, particles, time_step, max_duration, n_threads = None))]
 pub fn gb_fpt_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -119,17 +242,24 @@ pub fn gb_fpt_raw_moment(
     particles: usize,
     time_step: f64,
     max_duration: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<Option<f64>> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let fpt = FirstPassageTime::new(&gb, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let fpt = FirstPassageTime::new(&gb, domain)?;
+            let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the central moment of the first passage time of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, domain, order, particles, time_step, max_duration, n_threads = None))]
 pub fn gb_fpt_central_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -138,17 +268,23 @@ pub fn gb_fpt_central_moment(
     particles: usize,
     time_step: f64,
     max_duration: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<Option<f64>> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let fpt = FirstPassageTime::new(&gb, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let fpt = FirstPassageTime::new(&gb, domain)?;
+            let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the occupation time of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn gb_occupation_time(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -156,15 +292,19 @@ pub fn gb_occupation_time(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let gb = GeometricBm::new(start_position, mu, sigma)?;
+        let result = gb.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, domain, order, particles, time_step, duration, n_threads = None))]
 pub fn gb_occupation_time_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -173,17 +313,24 @@ pub fn gb_occupation_time_raw_moment(
     particles: usize,
     time_step: f64,
     duration: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let oc = OccupationTime::new(&gb, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let oc = OccupationTime::new(&gb, domain, duration)?;
+            let result = oc.raw_moment(order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the central moment of the occupation time of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, domain, order, particles, time_step, duration, n_threads = None))]
 pub fn gb_occupation_time_central_moment(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -192,17 +339,23 @@ pub fn gb_occupation_time_central_moment(
     particles: usize,
     time_step: f64,
     duration: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let oc = OccupationTime::new(&gb, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let oc = OccupationTime::new(&gb, domain, duration)?;
+            let result = oc.central_moment(order, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the time-averaged mean squared displacement of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn gb_tamsd(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -211,15 +364,43 @@ pub fn gb_tamsd(
     time_step: f64,
     quad_order: usize,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.tamsd(duration, delta, time_step, quad_order)?;
-    Ok(result)
+    py.detach(|| {
+        let gb = GeometricBm::new(start_position, mu, sigma)?;
+        let result = gb.tamsd(duration, delta, time_step, quad_order)?;
+        Ok(result)
+    })
+}
+
+/// Get the time-averaged mean squared displacement of Geometric Brownian Motion at
+/// every lag in `deltas`, all from one simulated path.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn gb_tamsd_curve(
+    py: Python<'_>,
+    start_position: f64,
+    mu: f64,
+    sigma: f64,
+    duration: f64,
+    deltas: Vec<f64>,
+    time_step: f64,
+) -> XPyResult<PyArrayVector<'_>> {
+    let lags = deltas
+        .iter()
+        .map(|&delta| tamsd_lag(py, duration, delta, time_step))
+        .collect::<XPyResult<Vec<usize>>>()?;
+    let result = py.detach(|| {
+        let gb = GeometricBm::new(start_position, mu, sigma)?;
+        tamsd_curve(&lags, || Ok(gb.simulate(duration, time_step)?))
+    })?;
+    Ok(result.into_pyarray(py))
 }
 
 /// Get the effective time-averaged mean squared displacement of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, delta, particles, time_step, quad_order, n_threads = None))]
 pub fn gb_eatamsd(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
@@ -228,40 +409,59 @@ pub fn gb_eatamsd(
     particles: usize,
     time_step: f64,
     quad_order: usize,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.eatamsd(duration, delta, particles, time_step, quad_order)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let result = gb.eatamsd(duration, delta, particles, time_step, quad_order)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the mean of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, particles, time_step, n_threads = None))]
 pub fn gb_mean(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
     duration: f64,
     particles: usize,
     time_step: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.mean(duration, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let result = gb.mean(duration, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
 
 /// Get the msd of Geometric Brownian Motion.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
+#[pyo3(signature = (start_position, mu, sigma, duration, particles, time_step, n_threads = None))]
 pub fn gb_msd(
+    py: Python<'_>,
     start_position: f64,
     mu: f64,
     sigma: f64,
     duration: f64,
     particles: usize,
     time_step: f64,
+    n_threads: Option<usize>,
 ) -> XPyResult<f64> {
-    let gb = GeometricBm::new(start_position, mu, sigma)?;
-    let result = gb.msd(duration, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        in_thread_pool(n_threads, || {
+            let gb = GeometricBm::new(start_position, mu, sigma)?;
+            let result = gb.msd(duration, particles, time_step)?;
+            Ok(result)
+        })
+    })
 }
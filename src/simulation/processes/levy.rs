@@ -1,6 +1,6 @@
 use crate::{
     XPyResult,
-    simulation::{PyArrayPair, vec_to_pyarray},
+    simulation::{PyArrayPair, kernels::chunked_occupation_time, vec_to_pyarray},
 };
 use diffusionx::simulation::{
     continuous::{AsymmetricLevy, Levy},
@@ -29,21 +29,25 @@ pub fn levy_simulate(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn levy_fpt(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     time_step: f64,
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let levy = Levy::new(start_position, alpha)?;
-    let result = levy.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = Levy::new(start_position, alpha)?;
+        let result = levy.fpt(domain, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the first passage time of Levy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn levy_fpt_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     domain: (f64, f64),
@@ -52,16 +56,19 @@ pub fn levy_fpt_raw_moment(
     max_duration: f64,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let levy = Levy::new(start_position, alpha)?;
-    let fpt = FirstPassageTime::new(&levy, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = Levy::new(start_position, alpha)?;
+        let fpt = FirstPassageTime::new(&levy, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Levy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn levy_fpt_central_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     domain: (f64, f64),
@@ -70,31 +77,45 @@ pub fn levy_fpt_central_moment(
     max_duration: f64,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let levy = Levy::new(start_position, alpha)?;
-    let fpt = FirstPassageTime::new(&levy, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = Levy::new(start_position, alpha)?;
+        let fpt = FirstPassageTime::new(&levy, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Levy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn levy_occupation_time(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     time_step: f64,
     domain: (f64, f64),
     duration: f64,
 ) -> XPyResult<f64> {
-    let levy = Levy::new(start_position, alpha)?;
-    let result = levy.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        Levy::new(start_position, alpha)?;
+        chunked_occupation_time(
+            start_position,
+            domain,
+            duration,
+            time_step,
+            |start, duration| {
+                let levy = Levy::new(start, alpha)?;
+                Ok(levy.simulate(duration, time_step)?)
+            },
+        )
+    })
 }
 
 /// Get the raw moment of the occupation time of Levy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn levy_occupation_time_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     domain: (f64, f64),
@@ -103,16 +124,19 @@ pub fn levy_occupation_time_raw_moment(
     particles: usize,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let levy = Levy::new(start_position, alpha)?;
-    let oc = OccupationTime::new(&levy, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = Levy::new(start_position, alpha)?;
+        let oc = OccupationTime::new(&levy, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Levy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn levy_occupation_time_central_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     domain: (f64, f64),
@@ -121,10 +145,12 @@ pub fn levy_occupation_time_central_moment(
     particles: usize,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let levy = Levy::new(start_position, alpha)?;
-    let oc = OccupationTime::new(&levy, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = Levy::new(start_position, alpha)?;
+        let oc = OccupationTime::new(&levy, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean squared displacement of Levy process.
@@ -244,6 +270,7 @@ pub fn asymmetric_levy_simulate(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_levy_fpt(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     beta: f64,
@@ -251,15 +278,18 @@ pub fn asymmetric_levy_fpt(
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
-    let result = levy.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
+        let result = levy.fpt(domain, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the first passage time of AsymmetricLevy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_levy_fpt_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     beta: f64,
@@ -269,16 +299,19 @@ pub fn asymmetric_levy_fpt_raw_moment(
     max_duration: f64,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
-    let fpt = FirstPassageTime::new(&levy, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
+        let fpt = FirstPassageTime::new(&levy, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of AsymmetricLevy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_levy_fpt_central_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     beta: f64,
@@ -288,16 +321,19 @@ pub fn asymmetric_levy_fpt_central_moment(
     max_duration: f64,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
-    let fpt = FirstPassageTime::new(&levy, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
+        let fpt = FirstPassageTime::new(&levy, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of AsymmetricLevy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_levy_occupation_time(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     beta: f64,
@@ -305,15 +341,26 @@ pub fn asymmetric_levy_occupation_time(
     domain: (f64, f64),
     duration: f64,
 ) -> XPyResult<f64> {
-    let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
-    let result = levy.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        AsymmetricLevy::new(start_position, alpha, beta)?;
+        chunked_occupation_time(
+            start_position,
+            domain,
+            duration,
+            time_step,
+            |start, duration| {
+                let levy = AsymmetricLevy::new(start, alpha, beta)?;
+                Ok(levy.simulate(duration, time_step)?)
+            },
+        )
+    })
 }
 
 /// Get the raw moment of the occupation time of AsymmetricLevy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_levy_occupation_time_raw_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     beta: f64,
@@ -323,16 +370,19 @@ pub fn asymmetric_levy_occupation_time_raw_moment(
     particles: usize,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
-    let oc = OccupationTime::new(&levy, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
+        let oc = OccupationTime::new(&levy, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of AsymmetricLevy process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn asymmetric_levy_occupation_time_central_moment(
+    py: Python<'_>,
     start_position: f64,
     alpha: f64,
     beta: f64,
@@ -342,10 +392,12 @@ pub fn asymmetric_levy_occupation_time_central_moment(
     particles: usize,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
-    let oc = OccupationTime::new(&levy, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let levy = AsymmetricLevy::new(start_position, alpha, beta)?;
+        let oc = OccupationTime::new(&levy, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean squared displacement of AsymmetricLevy process.
@@ -90,15 +90,18 @@ pub fn levy_walk_frac_central_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn levy_walk_fpt(
+    py: Python<'_>,
     alpha: f64,
     velocity: f64,
     start_position: f64,
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let levy_walk = LevyWalk::new(alpha, velocity, start_position)?;
-    let result = levy_walk.fpt(domain, max_duration, 0.1)?;
-    Ok(result)
+    py.detach(|| {
+        let levy_walk = LevyWalk::new(alpha, velocity, start_position)?;
+        let result = levy_walk.fpt(domain, max_duration, 0.1)?;
+        Ok(result)
+    })
 }
 
 /// Get the mean of Levy walk.
@@ -1,6 +1,6 @@
 use crate::{
     XPyResult,
-    simulation::{PyArrayPair, vec_to_pyarray},
+    simulation::{PyArrayPair, kernels::chunked_fpt, vec_to_pyarray},
 };
 use diffusionx::simulation::{continuous::OrnsteinUhlenbeck, prelude::*};
 use pyo3::prelude::*;
@@ -95,6 +95,7 @@ pub fn ou_frac_central_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ou_fpt(
+    py: Python<'_>,
     theta: f64,
     sigma: f64,
     start_position: f64,
@@ -102,15 +103,26 @@ pub fn ou_fpt(
     domain: (f64, f64),
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
-    let result = ou.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
+        chunked_fpt(
+            start_position,
+            domain,
+            max_duration,
+            time_step,
+            |start, duration| {
+                let ou = OrnsteinUhlenbeck::new(theta, sigma, start)?;
+                Ok(ou.simulate(duration, time_step)?)
+            },
+        )
+    })
 }
 
 /// Get the raw moment of the first passage time of Ornstein-Uhlenbeck process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ou_fpt_raw_moment(
+    py: Python<'_>,
     theta: f64,
     sigma: f64,
     start_position: f64,
@@ -120,16 +132,19 @@ pub fn ou_fpt_raw_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
-    let fpt = FirstPassageTime::new(&ou, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
+        let fpt = FirstPassageTime::new(&ou, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Ornstein-Uhlenbeck process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ou_fpt_central_moment(
+    py: Python<'_>,
     theta: f64,
     sigma: f64,
     start_position: f64,
@@ -139,16 +154,19 @@ pub fn ou_fpt_central_moment(
     time_step: f64,
     max_duration: f64,
 ) -> XPyResult<Option<f64>> {
-    let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
-    let fpt = FirstPassageTime::new(&ou, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
+        let fpt = FirstPassageTime::new(&ou, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Ornstein-Uhlenbeck process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ou_occupation_time(
+    py: Python<'_>,
     theta: f64,
     sigma: f64,
     start_position: f64,
@@ -156,15 +174,18 @@ pub fn ou_occupation_time(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
-    let result = ou.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
+        let result = ou.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of Ornstein-Uhlenbeck process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ou_occupation_time_raw_moment(
+    py: Python<'_>,
     theta: f64,
     sigma: f64,
     start_position: f64,
@@ -174,16 +195,19 @@ pub fn ou_occupation_time_raw_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
-    let oc = OccupationTime::new(&ou, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
+        let oc = OccupationTime::new(&ou, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Ornstein-Uhlenbeck process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn ou_occupation_time_central_moment(
+    py: Python<'_>,
     theta: f64,
     sigma: f64,
     start_position: f64,
@@ -193,10 +217,12 @@ pub fn ou_occupation_time_central_moment(
     time_step: f64,
     duration: f64,
 ) -> XPyResult<f64> {
-    let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
-    let oc = OccupationTime::new(&ou, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let ou = OrnsteinUhlenbeck::new(theta, sigma, start_position)?;
+        let oc = OccupationTime::new(&ou, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the time-averaged mean squared displacement of Ornstein-Uhlenbeck process.
@@ -102,32 +102,38 @@ pub fn poisson_fpt(lambda_: f64, domain: (f64, f64), max_duration: f64) -> XPyRe
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn poisson_fpt_raw_moment(
+    py: Python<'_>,
     lambda_: f64,
     domain: (f64, f64),
     max_duration: f64,
     order: i32,
     particles: usize,
 ) -> XPyResult<Option<f64>> {
-    let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
-    let fpt = FirstPassageTime::new(&poisson, domain)?;
-    let result = fpt.raw_moment_p(order, particles, max_duration)?;
-    Ok(result)
+    py.detach(|| {
+        let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
+        let fpt = FirstPassageTime::new(&poisson, domain)?;
+        let result = fpt.raw_moment_p(order, particles, max_duration)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of Poisson process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn poisson_fpt_central_moment(
+    py: Python<'_>,
     lambda_: f64,
     domain: (f64, f64),
     max_duration: f64,
     order: i32,
     particles: usize,
 ) -> XPyResult<Option<f64>> {
-    let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
-    let fpt = FirstPassageTime::new(&poisson, domain)?;
-    let result = fpt.central_moment_p(order, particles, max_duration)?;
-    Ok(result)
+    py.detach(|| {
+        let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
+        let fpt = FirstPassageTime::new(&poisson, domain)?;
+        let result = fpt.central_moment_p(order, particles, max_duration)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of Poisson process.
@@ -143,32 +149,38 @@ pub fn poisson_occupation_time(lambda_: f64, domain: (f64, f64), duration: f64)
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn poisson_occupation_time_raw_moment(
+    py: Python<'_>,
     lambda_: f64,
     domain: (f64, f64),
     duration: f64,
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
-    let oc = OccupationTime::new(&poisson, domain, duration)?;
-    let result = oc.raw_moment_p(order, particles)?;
-    Ok(result)
+    py.detach(|| {
+        let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
+        let oc = OccupationTime::new(&poisson, domain, duration)?;
+        let result = oc.raw_moment_p(order, particles)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of Poisson process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn poisson_occupation_time_central_moment(
+    py: Python<'_>,
     lambda_: f64,
     domain: (f64, f64),
     duration: f64,
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
-    let oc = OccupationTime::new(&poisson, domain, duration)?;
-    let result = oc.central_moment_p(order, particles)?;
-    Ok(result)
+    py.detach(|| {
+        let poisson: Poisson<f64, f64> = Poisson::new(lambda_)?;
+        let oc = OccupationTime::new(&poisson, domain, duration)?;
+        let result = oc.central_moment_p(order, particles)?;
+        Ok(result)
+    })
 }
 
 /// Get the mean of Poisson process.
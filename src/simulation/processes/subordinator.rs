@@ -43,20 +43,24 @@ pub fn subordinator_frac_raw_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn subordinator_fpt(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     max_duration: f64,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let subordinator = Subordinator::new(alpha)?;
-    let result = subordinator.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let subordinator = Subordinator::new(alpha)?;
+        let result = subordinator.fpt(domain, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the first passage time of subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn subordinator_fpt_raw_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     max_duration: f64,
@@ -64,16 +68,19 @@ pub fn subordinator_fpt_raw_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<Option<f64>> {
-    let subordinator = Subordinator::new(alpha)?;
-    let fpt = FirstPassageTime::new(&subordinator, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let subordinator = Subordinator::new(alpha)?;
+        let fpt = FirstPassageTime::new(&subordinator, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn subordinator_fpt_central_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     max_duration: f64,
@@ -81,30 +88,36 @@ pub fn subordinator_fpt_central_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<Option<f64>> {
-    let subordinator = Subordinator::new(alpha)?;
-    let fpt = FirstPassageTime::new(&subordinator, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let subordinator = Subordinator::new(alpha)?;
+        let fpt = FirstPassageTime::new(&subordinator, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn subordinator_occupation_time(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     duration: f64,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let subordinator = Subordinator::new(alpha)?;
-    let result = subordinator.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let subordinator = Subordinator::new(alpha)?;
+        let result = subordinator.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn subordinator_occupation_time_raw_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     duration: f64,
@@ -112,16 +125,19 @@ pub fn subordinator_occupation_time_raw_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let subordinator = Subordinator::new(alpha)?;
-    let oc = OccupationTime::new(&subordinator, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let subordinator = Subordinator::new(alpha)?;
+        let oc = OccupationTime::new(&subordinator, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn subordinator_occupation_time_central_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     duration: f64,
@@ -129,10 +145,12 @@ pub fn subordinator_occupation_time_central_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let subordinator = Subordinator::new(alpha)?;
-    let oc = OccupationTime::new(&subordinator, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let subordinator = Subordinator::new(alpha)?;
+        let oc = OccupationTime::new(&subordinator, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Simulate inverse subordinator process.
@@ -213,20 +231,24 @@ pub fn inv_subordinator_frac_central_moment(
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn inv_subordinator_fpt(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     max_duration: f64,
     time_step: f64,
 ) -> XPyResult<Option<f64>> {
-    let inv_subordinator = InvSubordinator::new(alpha)?;
-    let result = inv_subordinator.fpt(domain, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let inv_subordinator = InvSubordinator::new(alpha)?;
+        let result = inv_subordinator.fpt(domain, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the first passage time of inverse subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn inv_subordinator_fpt_raw_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     max_duration: f64,
@@ -234,16 +256,19 @@ pub fn inv_subordinator_fpt_raw_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<Option<f64>> {
-    let inv_subordinator = InvSubordinator::new(alpha)?;
-    let fpt = FirstPassageTime::new(&inv_subordinator, domain)?;
-    let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let inv_subordinator = InvSubordinator::new(alpha)?;
+        let fpt = FirstPassageTime::new(&inv_subordinator, domain)?;
+        let result = fpt.raw_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the first passage time of inverse subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn inv_subordinator_fpt_central_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     max_duration: f64,
@@ -251,30 +276,36 @@ pub fn inv_subordinator_fpt_central_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<Option<f64>> {
-    let inv_subordinator = InvSubordinator::new(alpha)?;
-    let fpt = FirstPassageTime::new(&inv_subordinator, domain)?;
-    let result = fpt.central_moment(order, particles, max_duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let inv_subordinator = InvSubordinator::new(alpha)?;
+        let fpt = FirstPassageTime::new(&inv_subordinator, domain)?;
+        let result = fpt.central_moment(order, particles, max_duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the occupation time of inverse subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn inv_subordinator_occupation_time(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     duration: f64,
     time_step: f64,
 ) -> XPyResult<f64> {
-    let inv_subordinator = InvSubordinator::new(alpha)?;
-    let result = inv_subordinator.occupation_time(domain, duration, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let inv_subordinator = InvSubordinator::new(alpha)?;
+        let result = inv_subordinator.occupation_time(domain, duration, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the raw moment of the occupation time of inverse subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn inv_subordinator_occupation_time_raw_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     duration: f64,
@@ -282,16 +313,19 @@ pub fn inv_subordinator_occupation_time_raw_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let inv_subordinator = InvSubordinator::new(alpha)?;
-    let oc = OccupationTime::new(&inv_subordinator, domain, duration)?;
-    let result = oc.raw_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let inv_subordinator = InvSubordinator::new(alpha)?;
+        let oc = OccupationTime::new(&inv_subordinator, domain, duration)?;
+        let result = oc.raw_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
 
 /// Get the central moment of the occupation time of inverse subordinator process.
 #[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
 #[pyfunction]
 pub fn inv_subordinator_occupation_time_central_moment(
+    py: Python<'_>,
     alpha: f64,
     domain: (f64, f64),
     duration: f64,
@@ -299,8 +333,10 @@ pub fn inv_subordinator_occupation_time_central_moment(
     order: i32,
     particles: usize,
 ) -> XPyResult<f64> {
-    let inv_subordinator = InvSubordinator::new(alpha)?;
-    let oc = OccupationTime::new(&inv_subordinator, domain, duration)?;
-    let result = oc.central_moment(order, particles, time_step)?;
-    Ok(result)
+    py.detach(|| {
+        let inv_subordinator = InvSubordinator::new(alpha)?;
+        let oc = OccupationTime::new(&inv_subordinator, domain, duration)?;
+        let result = oc.central_moment(order, particles, time_step)?;
+        Ok(result)
+    })
 }
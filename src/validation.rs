@@ -0,0 +1,177 @@
+use crate::{XPyError, XPyResult};
+use pyo3::{
+    prelude::*,
+    types::{PyBool, PyFloat, PyInt, PyTuple},
+};
+#[cfg(feature = "stub_gen")]
+use pyo3_stub_gen::derive::gen_stub_pyfunction;
+
+/// Validated `(order, central, particles, time_step, duration, domain)`.
+type MomentArgs<'py> = (Bound<'py, PyAny>, bool, usize, f64, f64, Option<(f64, f64)>);
+
+/// Validate the arguments shared by the moment estimators in one call.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+#[pyo3(signature = (order, central, particles, time_step, duration, domain = None, duration_name = "duration", process_name = ""))]
+pub fn validate_moment_args<'py>(
+    order: &Bound<'py, PyAny>,
+    central: &Bound<'py, PyAny>,
+    particles: &Bound<'py, PyAny>,
+    time_step: &Bound<'py, PyAny>,
+    duration: &Bound<'py, PyAny>,
+    domain: Option<&Bound<'py, PyAny>>,
+    duration_name: &str,
+    process_name: &str,
+) -> XPyResult<MomentArgs<'py>> {
+    let central = validate_bool(central, "central")?;
+    validate_order(order)?;
+    let domain = domain
+        .map(|domain| validate_domain(domain, process_name))
+        .transpose()?;
+    let particles = validate_positive_integer(particles, "particles")?;
+    let time_step = validate_positive_float(time_step, "time_step")?;
+    let duration = validate_positive_float(duration, duration_name)?;
+    Ok((order.clone(), central, particles, time_step, duration, domain))
+}
+
+/// Ensure the input value is a float, converting from int if necessary.
+#[cfg_attr(feature = "stub_gen", gen_stub_pyfunction)]
+#[pyfunction]
+pub fn ensure_float(value: &Bound<'_, PyAny>) -> XPyResult<f64> {
+    extract_real(value)
+}
+
+/// Extract a real number, accepting `float` and `int` but rejecting `bool`.
+pub(crate) fn extract_real(value: &Bound<'_, PyAny>) -> XPyResult<f64> {
+    if value.is_instance_of::<PyBool>() {
+        return Err(XPyError::TypeError(
+            "Expected float or int, got bool".to_string(),
+        ));
+    }
+    if value.is_instance_of::<PyFloat>() || value.is_instance_of::<PyInt>() {
+        return value
+            .extract::<f64>()
+            .map_err(|error| XPyError::ValueError(error.to_string()));
+    }
+    Err(XPyError::TypeError(format!(
+        "Expected float or int, got {}",
+        type_name(value)
+    )))
+}
+
+pub(crate) fn validate_bool(value: &Bound<'_, PyAny>, name: &str) -> XPyResult<bool> {
+    if !value.is_instance_of::<PyBool>() {
+        return Err(XPyError::TypeError(format!(
+            "{name} must be a boolean, got {}",
+            type_name(value)
+        )));
+    }
+    Ok(value.is_truthy().unwrap_or(false))
+}
+
+pub(crate) fn validate_order(order: &Bound<'_, PyAny>) -> XPyResult<f64> {
+    let value = extract_real(order).map_err(|_| {
+        XPyError::TypeError(format!(
+            "order must be an integer or float, got {}",
+            type_name(order)
+        ))
+    })?;
+    if !value.is_finite() {
+        return Err(XPyError::InvalidArgument(format!(
+            "order must be finite, got {order}"
+        )));
+    }
+    if value < 0.0 {
+        return Err(XPyError::InvalidArgument(format!(
+            "order must be non-negative, got {order}"
+        )));
+    }
+    Ok(value)
+}
+
+pub(crate) fn validate_positive_integer(value: &Bound<'_, PyAny>, name: &str) -> XPyResult<usize> {
+    if value.is_instance_of::<PyBool>() || !value.is_instance_of::<PyInt>() {
+        return Err(XPyError::TypeError(format!(
+            "{name} must be an integer, got {}",
+            type_name(value)
+        )));
+    }
+    match value.extract::<i64>() {
+        Ok(integer) if integer <= 0 => {
+            Err(XPyError::InvalidArgument(format!("{name} must be positive")))
+        }
+        Ok(integer) => Ok(integer as usize),
+        Err(error) => Err(XPyError::InvalidArgument(format!("{name} is out of range: {error}"))),
+    }
+}
+
+pub(crate) fn validate_positive_float(value: &Bound<'_, PyAny>, name: &str) -> XPyResult<f64> {
+    let py = value.py();
+    let value = extract_real(value).map_err(|error| {
+        XPyError::TypeError(format!("{name} must be a number. Error: {error}"))
+    })?;
+    if !value.is_finite() {
+        return Err(XPyError::InvalidArgument(format!(
+            "{name} must be finite, got {}",
+            float_str(py, value)
+        )));
+    }
+    if value <= 0.0 {
+        return Err(XPyError::InvalidArgument(format!(
+            "{name} must be positive, got {}",
+            float_str(py, value)
+        )));
+    }
+    Ok(value)
+}
+
+pub(crate) fn validate_domain(domain: &Bound<'_, PyAny>, process_name: &str) -> XPyResult<(f64, f64)> {
+    let suffix = if process_name.is_empty() {
+        String::new()
+    } else {
+        format!(" for {process_name}")
+    };
+    let pair = domain
+        .cast::<PyTuple>()
+        .ok()
+        .filter(|pair| pair.len() == 2)
+        .ok_or_else(|| {
+            XPyError::TypeError(format!(
+                "domain must be a tuple of two real numbers{suffix}, got {}",
+                type_name(domain)
+            ))
+        })?;
+    let bounds = pair
+        .get_item(0)
+        .and_then(|a| Ok((a, pair.get_item(1)?)))
+        .map_err(|error| XPyError::ValueError(error.to_string()))?;
+    let (a, b) = extract_real(&bounds.0)
+        .and_then(|a| Ok((a, extract_real(&bounds.1)?)))
+        .map_err(|error| {
+            XPyError::TypeError(format!(
+                "Domain elements must be numbers convertible to float{suffix}. Error: {error}"
+            ))
+        })?;
+    if a >= b {
+        let py = domain.py();
+        return Err(XPyError::InvalidArgument(format!(
+            "Invalid domain [{}, {}]; domain[0] must be strictly less than domain[1]{suffix}",
+            float_str(py, a),
+            float_str(py, b)
+        )));
+    }
+    Ok((a, b))
+}
+
+/// `str(value)` of a Python float, so messages format numbers as Python does.
+pub(crate) fn float_str(py: Python<'_>, value: f64) -> String {
+    PyFloat::new(py, value).to_string()
+}
+
+fn type_name(value: &Bound<'_, PyAny>) -> String {
+    value
+        .get_type()
+        .name()
+        .map(|name| name.to_string())
+        .unwrap_or_else(|_| "object".to_string())
+}